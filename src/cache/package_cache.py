@@ -56,9 +56,6 @@ class PackageCacheModel:
     
     def rebuild_indexes(self) -> None:
         """Rebuild all indexes from cached packages"""
-        # Clear existing indexes
-        self._clear_backend_indexes()
-        
         # Collect all index data first
         section_indexes = {}  # section -> [package_ids]
         installed_packages = []
@@ -75,6 +72,18 @@ class PackageCacheModel:
             if package.is_installed:
                 installed_packages.append(package.package_id)
         
+        self.write_indexes(section_indexes, installed_packages)
+    
+    def write_indexes(self, section_indexes: Dict[str, List[str]], installed_packages: List[str]) -> None:
+        """Replace the section and installed indexes with the given ones
+        
+        Args:
+            section_indexes: Section name -> package IDs in that section
+            installed_packages: IDs of installed packages
+        """
+        # Clear existing indexes
+        self._clear_backend_indexes()
+        
         # Write all indexes in bulk
         indexes_db = self.lmdb.get_db(self.indexes_db)
         with self.lmdb.transaction(write=True) as txn:
@@ -245,6 +254,12 @@ class PackageCacheModel:
         packages = self.get_all_packages(limit=1)
         return len(packages) == 0
     
+    def count_packages(self) -> int:
+        """Get the number of cached packages without reading them"""
+        db = self.lmdb.get_db(self.db_name)
+        with self.lmdb.transaction() as txn:
+            return txn.stat(db)['entries']
+    
     def _update_indexes(self, package: PackageData):
         """Update search indexes for package"""
         # Section index
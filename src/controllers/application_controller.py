@@ -1,4 +1,5 @@
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtCore import QTimer
 from config.app_config import AppConfig
 from services.service_container import ServiceContainer
 from services.theme_service import ThemeService
@@ -17,15 +18,60 @@ class ApplicationController:
         self.container = ServiceContainer()
         self.main_view = None
         self.splash = None
+        self._startup = None
     
     def initialize(self) -> None:
-        """Initialize all services and components"""
+        """Show the splash and schedule startup on the Qt event loop
+        
+        Startup runs as a generator of steps; each ``yield`` hands control
+        back to the event loop so the splash repaints between steps. The
+        main window is shown once the last step completes.
+        """
         self._show_splash()
+        self._startup = self._startup_steps()
+        QTimer.singleShot(0, self._advance_startup)
+    
+    def _startup_steps(self):
+        """Initialize all services and components, yielding between steps"""
         self._setup_theme()
+        yield
         self._initialize_services()
-        self._populate_cache()
-        self._create_main_view()
+        yield
+        yield from self._populate_cache()
+        yield from self._create_main_view()
+        yield
         self._setup_dev_mode()
+        self.show_main_window()
+    
+    def _advance_startup(self) -> None:
+        """Run the next startup step and reschedule until finished"""
+        if self._startup is None:
+            return
+        try:
+            next(self._startup)
+        except StopIteration:
+            self._startup = None
+            return
+        except Exception as e:
+            self._startup = None
+            self._startup_failed(e)
+            return
+        QTimer.singleShot(0, self._advance_startup)
+    
+    def _startup_failed(self, error: Exception) -> None:
+        """Report a failed startup step instead of leaving the splash up"""
+        import traceback
+        traceback.print_exc()
+        if self.container.has('logging'):
+            self.container.get('logging').get_logger('startup').error(
+                f"Startup failed: {error}", data=traceback.format_exc()
+            )
+        
+        if self.splash:
+            self.splash.close()
+            self.splash = None
+        QMessageBox.critical(None, "Startup Error", f"Apt-Ex Package Manager failed to start:\n{error}")
+        self.app.exit(1)
     
     def _show_splash(self) -> None:
         """Show splash screen"""
@@ -72,8 +118,8 @@ class ApplicationController:
         package_manager = PackageManager(lmdb_manager, logging_service, app_settings)
         self.container.register('package_manager', package_manager)
     
-    def _populate_cache(self) -> None:
-        """Populate cache before creating main view"""
+    def _populate_cache(self):
+        """Populate cache before creating main view, yielding after progress updates"""
         from controllers.apt_controller import APTController
         from cache import PackageData
         import time
@@ -91,6 +137,7 @@ class ApplicationController:
         
         if self.splash:
             self.splash.update_progress(5, "Checking cache status...")
+            yield
         
         # Check if cache is empty
         pkg_cache = PackageCacheModel(lmdb_manager, 'apt')
@@ -102,11 +149,13 @@ class ApplicationController:
             logger.info("Cache is empty, building initial cache...")
             if self.splash:
                 self.splash.update_progress(10, "Building APT package cache...")
+                yield
         else:
             print("Refreshing package cache...")
             logger.info("Refreshing package cache...")
             if self.splash:
                 self.splash.update_progress(10, "Refreshing APT package cache...")
+                yield
         elapsed = time.time() - check_time
         print(f"Cache check took: {elapsed:.2f}s")
         logger.info(f"Cache check took: {elapsed:.2f}s")
@@ -115,28 +164,26 @@ class ApplicationController:
         apt_controller = APTController(logging_service=logging_service)
         
         # Load packages
-        load_start = time.time()
         print("Loading package details from APT...")
         logger.info("Loading package details from APT...")
         if self.splash:
             self.splash.update_progress(15, "Loading APT package database...")
+            yield
         
-        packages = apt_controller.get_all_packages_for_cache()
-        load_time = time.time() - load_start
-        print(f"Loaded {len(packages)} packages in {load_time:.2f}s")
-        logger.info(f"Loaded {len(packages)} packages in {load_time:.2f}s")
-        
-        # Cache packages in batches using bulk insert with parallel processing
+        # Stream packages from APT into LMDB a batch at a time; the previous
+        # cache size stands in for the total to estimate progress
         cache_start = time.time()
         print("Caching packages...")
         logger.info("Caching packages...")
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from itertools import islice
         
         batch_size = 5000  # Larger batches for bulk insert
-        total = len(packages)
+        expected = pkg_cache.count_packages()
+        packages = apt_controller.iter_packages_for_cache()
+        total = 0
         
         def prepare_batch(batch_data):
-            """Prepare PackageData objects in parallel"""
+            """Prepare PackageData objects for a batch"""
             package_objects = []
             for pkg_data in batch_data:
                 package = PackageData(
@@ -151,40 +198,30 @@ class ApplicationController:
                     installed_size=pkg_data.get('installed_size'),
                     maintainer=pkg_data.get('maintainer'),
                     homepage=pkg_data.get('homepage'),
+                    is_installed=pkg_data.get('is_installed', False),
                     metadata=pkg_data.get('metadata', {})
                 )
                 package_objects.append(package)
             return package_objects
         
-        # Prepare batches
-        batches = []
-        for batch_start in range(0, total, batch_size):
-            batch_end = min(batch_start + batch_size, total)
-            batches.append((batch_start, packages[batch_start:batch_end]))
-        
-        # Process batches in parallel (data preparation)
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = {executor.submit(prepare_batch, batch_data): batch_start 
-                      for batch_start, batch_data in batches}
+        while True:
+            batch_data = list(islice(packages, batch_size))
+            if not batch_data:
+                break
             
-            completed = 0
-            for future in as_completed(futures):
-                batch_start = futures[future]
-                package_objects = future.result()
-                
-                # Write to LMDB without index updates (single-threaded, serialized)
-                pkg_cache.add_packages_bulk(package_objects, update_indexes=False)
-                
-                completed += len(package_objects)
-                
-                # Update progress (15% to 85% for caching)
-                progress = 15 + int((completed / total) * 70)
-                if self.splash:
-                    self.splash.update_progress(
-                        progress,
-                        "Caching APT packages...",
-                        f"Cached {completed:,} / {total:,} packages"
-                    )
+            # Write to LMDB without index updates
+            pkg_cache.add_packages_bulk(prepare_batch(batch_data), update_indexes=False)
+            total += len(batch_data)
+            
+            # Update progress (15% to 85% for caching)
+            if self.splash:
+                progress = 15 + int(min(total / expected, 1) * 70) if expected else 15
+                self.splash.update_progress(
+                    progress,
+                    "Caching APT packages...",
+                    f"Cached {total:,} packages"
+                )
+                yield
         
         cache_time = time.time() - cache_start
         print(f"Cached {total} packages in {cache_time:.2f}s ({total/cache_time:.0f} pkg/s)")
@@ -195,6 +232,7 @@ class ApplicationController:
         print("Rebuilding indexes...")
         if self.splash:
             self.splash.update_progress(88, "Rebuilding indexes...")
+            yield
         pkg_cache.rebuild_indexes()
         index_time = time.time() - index_start
         print(f"Rebuilt indexes in {index_time:.2f}s")
@@ -206,6 +244,7 @@ class ApplicationController:
         logger.info("Updating installed package status...")
         if self.splash:
             self.splash.update_progress(90, "Updating APT installed status...")
+            yield
         
         apt_controller.update_installed_status(lmdb_manager)
         status_time = time.time() - status_start
@@ -217,11 +256,13 @@ class ApplicationController:
         logger.info(f"=== Cache population complete in {total_time:.2f}s ===")
         if self.splash:
             self.splash.update_progress(95, "APT cache ready", f"Loaded {total:,} packages")
+            yield
     
-    def _create_main_view(self) -> None:
-        """Create main view with dependency injection"""
+    def _create_main_view(self):
+        """Create main view with dependency injection, yielding to paint the splash first"""
         if self.splash:
             self.splash.update_progress(98, "Loading user interface...")
+            yield
         
         self.main_view = MainView(
             self.container.get('package_manager'),
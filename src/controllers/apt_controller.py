@@ -1,5 +1,6 @@
 from models.package_model import Package
-from typing import List, Set
+from collections import Counter
+from typing import Iterator, List, Set
 
 class APTController:
     def __init__(self, lmdb_manager=None, logging_service=None):
@@ -172,28 +173,11 @@ class APTController:
         try:
             import apt
             cache = apt.Cache()
-            section_details = {}
-            
-            for package in cache:
-                if hasattr(package.candidate, 'section') and package.candidate.section:
-                    section = package.candidate.section
-                    
-                    if '/' in section:
-                        # Parse hierarchical sections like "games/action"
-                        parts = section.split('/', 1)
-                        main_category = parts[0]
-                        subcategory = parts[1]
-                        
-                        if main_category not in section_details:
-                            section_details[main_category] = {}
-                        if subcategory not in section_details[main_category]:
-                            section_details[main_category][subcategory] = 0
-                        section_details[main_category][subcategory] += 1
-                    else:
-                        # Flat section
-                        if section not in section_details:
-                            section_details[section] = 0
-                        section_details[section] += 1
+            section_counts = Counter(
+                package.candidate.section for package in cache
+                if hasattr(package.candidate, 'section') and package.candidate.section
+            )
+            section_details = self.build_section_details(section_counts)
             
             self.log(f"Loaded {len(section_details)} APT sections")
             return section_details
@@ -205,6 +189,21 @@ class APTController:
                 self.logger.error(f"Error loading APT sections: {e}")
             return {}
     
+    @staticmethod
+    def build_section_details(section_counts) -> dict:
+        """Group per-section package counts into hierarchical categories"""
+        section_details = {}
+        for section, count in section_counts.items():
+            if '/' in section:
+                # Parse hierarchical sections like "games/action"
+                main_category, subcategory = section.split('/', 1)
+                subcategories = section_details.setdefault(main_category, {})
+                subcategories[subcategory] = subcategories.get(subcategory, 0) + count
+            else:
+                # Flat section
+                section_details[section] = section_details.get(section, 0) + count
+        return section_details
+    
     def get_upgradable_packages(self) -> List[dict]:
         """Get list of packages with available updates"""
         self.log("Checking for package updates")
@@ -253,11 +252,16 @@ class APTController:
     
     def get_all_packages_for_cache(self) -> List:
         """Get all package details for caching"""
+        packages = list(self.iter_packages_for_cache())
+        self.log(f"Loaded {len(packages)} APT packages")
+        return packages
+    
+    def iter_packages_for_cache(self) -> Iterator[dict]:
+        """Yield package details for caching one package at a time"""
         self.log("Loading all APT packages for cache")
         try:
             import apt
             cache = apt.Cache()
-            packages = []
             
             for package in cache:
                 if package.candidate:
@@ -275,6 +279,7 @@ class APTController:
                         'installed_size': getattr(package.candidate, 'installed_size', 0),
                         'maintainer': getattr(package.candidate.record, 'get', lambda x, y: '')('Maintainer', ''),
                         'homepage': getattr(package.candidate.record, 'get', lambda x, y: '')('Homepage', ''),
+                        'is_installed': package.is_installed,
                         'metadata': {}
                     }
                     
@@ -288,14 +293,9 @@ class APTController:
                         if 'Priority' in record:
                             pkg_data['metadata']['priority'] = record['Priority']
                     
-                    packages.append(pkg_data)
-            
-            self.log(f"Loaded {len(packages)} APT packages")
-            return packages
+                    yield pkg_data
         except ImportError:
             self.log("APT library not available")
-            return []
         except Exception as e:
             if self.logger:
-                self.logger.error(f"Error loading APT packages: {e}")
-            return []
\ No newline at end of file
+                self.logger.error(f"Error loading APT packages: {e}")
\ No newline at end of file
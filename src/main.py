@@ -6,6 +6,7 @@ from PyQt6.QtNetwork import QLocalSocket, QLocalServer
 from PyQt6.QtCore import QByteArray, Qt
 from config.app_config import AppConfig
 from controllers.application_controller import ApplicationController
+from widgets.base_list_item import install_style_sheet
 
 def main():
     config = AppConfig.parse_arguments()
@@ -58,11 +59,12 @@ def main():
     
     server.newConnection.connect(on_new_connection)
     
-    if config.dev_outline:
-        app.setStyleSheet("* { border: 1px solid red; }")
+    # List item styles live in the application stylesheet so each item
+    # doesn't parse its own
+    install_style_sheet(app, config.dev_outline)
     
+    # Startup runs on the event loop and shows the main window when done
     app_controller.initialize()
-    app_controller.show_main_window()
     
     try:
         sys.exit(app.exec())
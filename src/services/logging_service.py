@@ -26,6 +26,7 @@ class LoggingService(QObject):
         
         # Track registered loggers
         self.registered_loggers = set()
+        self._logger_wrappers = {}  # name -> LoggerWrapper handed out by get_logger
         # Register root logger
         self.registered_loggers.add(app_name)
         
@@ -86,6 +87,10 @@ class LoggingService(QObject):
     
     def get_logger(self, name: str):
         """Get a named logger wrapper that supports data parameter"""
+        wrapper = self._logger_wrappers.get(name)
+        if wrapper is not None:
+            return wrapper
+        
         full_name = f"{self.app_name}.{name}"
         named_logger = logging.getLogger(full_name)
         named_logger.setLevel(logging.DEBUG)
@@ -111,7 +116,9 @@ class LoggingService(QObject):
                     # Other handlers (app log handler, file handler)
                     named_logger.addHandler(handler)
         
-        return LoggerWrapper(named_logger)
+        wrapper = LoggerWrapper(named_logger)
+        self._logger_wrappers[name] = wrapper
+        return wrapper
         
 
     
@@ -230,6 +237,7 @@ class AppLogHandler(logging.Handler):
         # Store message with optional data for log view
         log_entry = {
             'message': message,
+            'level': record.levelname,
             'data': data_json
         }
         self.logging_service._log_messages.append(log_entry)
@@ -3,7 +3,7 @@ import json
 from typing import Dict, Optional, List
 from dataclasses import dataclass
 import time
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QThread, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 
 @dataclass
 class PackageRating:
@@ -26,6 +26,50 @@ class ODRSWorker(QThread):
         ratings = self.odrs_service._fetch_ratings_sync(self.app_ids)
         self.ratings_fetched.emit(ratings)
 
+
+# APT package name to ODRS app ID, based on actual ODRS data; others use <name>.desktop
+_APP_ID_MAPPINGS = {
+    'firefox': 'org.mozilla.Firefox',
+    'firefox-esr': 'firefox-esr.desktop',
+    'thunderbird': 'thunderbird.desktop',
+    'libreoffice': 'libreoffice-startcenter.desktop',
+    'gimp': 'gimp.desktop',
+    'vlc': 'vlc.desktop',
+    'code': 'code.desktop',
+    'chromium-browser': 'chromium.desktop',
+    'blender': 'blender.desktop',
+    'inkscape': 'inkscape.desktop',
+    'audacity': 'audacity.desktop',
+    'obs-studio': 'obs.desktop',
+    'steam': 'steam.desktop',
+    'discord': 'discord.desktop',
+    'telegram-desktop': 'telegram.desktop',
+    'spotify-client': 'spotify.desktop'
+}
+
+
+class CachedRatingSignals(QObject):
+    """Signals for CachedRatingLookup"""
+    finished_signal = pyqtSignal(dict)  # {app_id: PackageRating or None}
+
+class CachedRatingLookup(QRunnable):
+    """Pooled task reading a batch of ratings from the local cache"""
+    
+    def __init__(self, app_ids, odrs_service):
+        super().__init__()
+        self.app_ids = app_ids
+        self.odrs_service = odrs_service
+        self.signals = CachedRatingSignals()
+    
+    def run(self):
+        ratings = {}
+        for app_id in self.app_ids:
+            try:
+                ratings[app_id] = self.odrs_service._get_cached_rating(app_id)
+            except Exception:
+                ratings[app_id] = None
+        self.signals.finished_signal.emit(ratings)
+
 class ODRSService:
     """Service for fetching package ratings from GNOME ODRS API"""
     
@@ -48,6 +92,11 @@ class ODRSService:
         
         # Initialize SQLite cache - will be set by MainView
         self.cache_model = None
+        
+        # Cached rating lookups requested by list items, batched per event loop pass
+        self._rating_callbacks = {}  # app_id -> [callback]
+        self._queued_app_ids = []
+        self._active_lookups = []
         self.logger.debug("ODRS service initialized")
     
     def get_ratings_async(self, app_ids: List[str], callback):
@@ -96,6 +145,41 @@ class ODRSService:
         existing_results.update(new_ratings)
         callback(existing_results)
     
+    def get_cached_rating_async(self, app_id: str, callback):
+        """Look up a cached rating off the GUI thread
+        
+        Requests made during one event loop pass share a single pooled task;
+        callback receives the PackageRating or None on the GUI thread.
+        """
+        callbacks = self._rating_callbacks.get(app_id)
+        if callbacks is not None:
+            callbacks.append(callback)
+            return
+        
+        self._rating_callbacks[app_id] = [callback]
+        if not self._queued_app_ids:
+            QTimer.singleShot(0, self._start_cached_rating_lookup)
+        self._queued_app_ids.append(app_id)
+    
+    def _start_cached_rating_lookup(self):
+        """Hand the queued app IDs to the thread pool"""
+        app_ids, self._queued_app_ids = self._queued_app_ids, []
+        if not app_ids:
+            return
+        
+        lookup = CachedRatingLookup(app_ids, self)
+        lookup.signals.finished_signal.connect(lambda ratings: self._on_cached_ratings(lookup, ratings))
+        self._active_lookups.append(lookup)
+        QThreadPool.globalInstance().start(lookup)
+    
+    def _on_cached_ratings(self, lookup, ratings):
+        """Deliver cached ratings to the waiting callbacks"""
+        if lookup in self._active_lookups:
+            self._active_lookups.remove(lookup)
+        for app_id, rating in ratings.items():
+            for callback in self._rating_callbacks.pop(app_id, ()):
+                callback(rating)
+    
     def _fetch_ratings_sync(self, app_ids: List[str]) -> Dict[str, PackageRating]:
         """Synchronous rating fetch for worker thread"""
         results = {}
@@ -201,27 +285,7 @@ class ODRSService:
     
     def map_package_to_app_id(self, package_name: str) -> str:
         """Map APT package name to ODRS app ID"""
-        # Based on actual ODRS data, use desktop file names or app IDs
-        mappings = {
-            'firefox': 'org.mozilla.Firefox',
-            'firefox-esr': 'firefox-esr.desktop',
-            'thunderbird': 'thunderbird.desktop',
-            'libreoffice': 'libreoffice-startcenter.desktop',
-            'gimp': 'gimp.desktop',
-            'vlc': 'vlc.desktop',
-            'code': 'code.desktop',
-            'chromium-browser': 'chromium.desktop',
-            'blender': 'blender.desktop',
-            'inkscape': 'inkscape.desktop',
-            'audacity': 'audacity.desktop',
-            'obs-studio': 'obs.desktop',
-            'steam': 'steam.desktop',
-            'discord': 'discord.desktop',
-            'telegram-desktop': 'telegram.desktop',
-            'spotify-client': 'spotify.desktop'
-        }
-        
-        return mappings.get(package_name, f"{package_name}.desktop")
+        return _APP_ID_MAPPINGS.get(package_name, f"{package_name}.desktop")
     
     def close(self):
         """Close the requests session to release resources"""
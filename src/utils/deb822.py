@@ -0,0 +1,18 @@
+"""Helpers for DEB822-formatted APT files"""
+
+
+def iter_stanzas(f):
+    """Yield DEB822 stanzas from a file object as lists of lines
+    
+    Stanzas are separated by blank lines; only one stanza is held in
+    memory at a time.
+    """
+    buf = []
+    for line in f:
+        if line.strip():
+            buf.append(line)
+        elif buf:
+            yield buf
+            buf = []
+    if buf:
+        yield buf
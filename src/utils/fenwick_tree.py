@@ -0,0 +1,46 @@
+"""Fenwick tree (binary indexed tree) of row heights"""
+
+from typing import List
+
+
+class FenwickTree:
+    """Prefix sums over a list of non-negative values with O(log n) updates"""
+    
+    def __init__(self, size: int, value: int = 0):
+        self.size = size
+        # Every value starts equal, so node i covers (i & -i) of them
+        self._tree: List[int] = [value * (i & -i) for i in range(size + 1)]
+        self._total = value * size
+    
+    def add(self, index: int, delta: int):
+        """Add delta to the value at index"""
+        self._total += delta
+        i = index + 1
+        while i <= self.size:
+            self._tree[i] += delta
+            i += i & -i
+    
+    def prefix_sum(self, count: int) -> int:
+        """Sum of the first count values"""
+        result = 0
+        i = count
+        while i > 0:
+            result += self._tree[i]
+            i -= i & -i
+        return result
+    
+    def total(self) -> int:
+        """Sum of all values"""
+        return self._total
+    
+    def find(self, offset: int) -> int:
+        """Largest count whose prefix sum is <= offset, i.e. the index containing offset"""
+        pos = 0
+        step = 1 << self.size.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and self._tree[nxt] <= offset:
+                pos = nxt
+                offset -= self._tree[nxt]
+            step >>= 1
+        return pos
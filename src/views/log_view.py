@@ -6,7 +6,7 @@ from typing import List
 import logging
 from settings.app_settings import AppSettings
 
-from widgets.virtual_log_container import VirtualLogContainer
+from widgets.virtual_log_container import VirtualLogContainer, entry_level
 
 class LogView(QMainWindow):
     """Independent log view window with colored log levels"""
@@ -120,8 +120,11 @@ class LogView(QMainWindow):
     
 
     
-    def populate_logs(self):
-        """Populate log view with colored entries using virtual scrolling"""
+    def populate_logs(self, reset_rows=False):
+        """Populate log view with colored entries using virtual scrolling
+        
+        reset_rows collapses and deselects every row; filter changes pass it.
+        """
         # Recursion guard - prevent infinite loop
         if self._populating_logs:
             return
@@ -177,12 +180,7 @@ class LogView(QMainWindow):
                 else:
                     message = entry
                 
-                # Extract log level from message
-                level = 'INFO'
-                for lvl in ['CRITICAL', 'ERROR', 'WARNING', 'INFO', 'DEBUG']:
-                    if lvl in message:
-                        level = lvl
-                        break
+                level = entry_level(entry)
                 
                 # Extract logger name from message
                 logger_name = 'root'
@@ -202,7 +200,7 @@ class LogView(QMainWindow):
             
             # Update virtual container
             self.log_container.set_log_entries(log_entries, colors)
-            self.log_container.set_filtered_entries(filtered_entries)
+            self.log_container.set_filtered_entries(filtered_entries, reset_state=reset_rows)
             
         finally:
             self._populating_logs = False
@@ -277,7 +275,7 @@ class LogView(QMainWindow):
         else:
             self.level_button.setText(f"{len(checked_levels)} Levels")
         
-        self.populate_logs()  # Refresh display
+        self.populate_logs(reset_rows=True)  # Refresh display
     
     def update_logger_menu(self, messages):
         """Update logger menu with active loggers at top, inactive at bottom with separator"""
@@ -346,7 +344,7 @@ class LogView(QMainWindow):
         else:
             self.logger_button.setText(f"{len(checked_loggers)} Loggers")
         
-        self.populate_logs()  # Refresh display
+        self.populate_logs(reset_rows=True)  # Refresh display
     
     def on_search_text_changed(self):
         """Handle search text change with delay"""
@@ -360,7 +358,7 @@ class LogView(QMainWindow):
         # Require at least 2 characters or empty string (to clear search)
         if len(search_text) >= 2 or len(search_text) == 0:
             self.search_text = search_text
-            self.populate_logs()  # Refresh display
+            self.populate_logs(reset_rows=True)  # Refresh display
     
     def fuzzy_match(self, text: str, search: str) -> bool:
         """Perform fuzzy or exact matching on text with word boundary support"""
@@ -267,8 +267,8 @@ class MainView(QMainWindow):
         """Update context actions for current panel"""
         # Clear existing actions
         layout = self.contextActions.layout()
-        while layout.count():
-            child = layout.takeAt(0)
+        for i in reversed(range(layout.count())):
+            child = layout.takeAt(i)
             if child.widget():
                 child.widget().deleteLater()
         
@@ -322,7 +322,7 @@ class MainView(QMainWindow):
         from workers.package_operation_worker import PackageOperationWorker
         self.operation_worker = PackageOperationWorker(backend_obj, 'install', package_name, self.logging_service)
         self.operation_worker.command_started.connect(self.on_command_started)
-        self.operation_worker.output_line.connect(self.on_output_line)
+        self.operation_worker.output_lines.connect(self.on_output_lines)
         self.operation_worker.finished.connect(self.on_install_finished)
         self.operation_worker.error.connect(self.on_operation_error)
         
@@ -338,9 +338,9 @@ class MainView(QMainWindow):
             package = self.operation_worker.package_name
             self.operation_panel.set_operation(operation, package, command)
     
-    def on_output_line(self, line: str):
-        """Handle output line from operation"""
-        self.operation_panel.append_output(line)
+    def on_output_lines(self, lines):
+        """Handle new output lines from operation"""
+        self.operation_panel.append_lines(lines)
     
     def on_install_finished(self, success, package_name):
         """Handle install completion"""
@@ -363,7 +363,7 @@ class MainView(QMainWindow):
         from workers.package_operation_worker import PackageOperationWorker
         self.operation_worker = PackageOperationWorker(backend_obj, 'remove', package_name, self.logging_service)
         self.operation_worker.command_started.connect(self.on_command_started)
-        self.operation_worker.output_line.connect(self.on_output_line)
+        self.operation_worker.output_lines.connect(self.on_output_lines)
         self.operation_worker.finished.connect(self.on_remove_finished)
         self.operation_worker.error.connect(self.on_operation_error)
         
@@ -382,7 +382,7 @@ class MainView(QMainWindow):
     
     def on_operation_error(self, error_message):
         """Handle operation error"""
-        self.operation_panel.append_output(f"\nError: {error_message}")
+        self.operation_panel.append_line(f"Error: {error_message}")
         self.status_service.set_operation_complete(False, error_message)
     
     def refresh_current_panel(self):
@@ -423,7 +423,7 @@ class MainView(QMainWindow):
         from workers.package_operation_worker import PackageOperationWorker
         self.operation_worker = PackageOperationWorker(backend_obj, 'update', package_name, self.logging_service)
         self.operation_worker.command_started.connect(self.on_command_started)
-        self.operation_worker.output_line.connect(self.on_output_line)
+        self.operation_worker.output_lines.connect(self.on_output_lines)
         self.operation_worker.finished.connect(self.on_update_finished)
         self.operation_worker.error.connect(self.on_operation_error)
         
@@ -456,7 +456,7 @@ class MainView(QMainWindow):
         from workers.package_operation_worker import PackageOperationWorker
         self.operation_worker = PackageOperationWorker(backend_obj, 'update_all', 'all packages', self.logging_service)
         self.operation_worker.command_started.connect(self.on_command_started)
-        self.operation_worker.output_line.connect(self.on_output_line)
+        self.operation_worker.output_lines.connect(self.on_output_lines)
         self.operation_worker.finished.connect(self.on_update_all_finished)
         self.operation_worker.error.connect(self.on_operation_error)
         
@@ -485,6 +485,7 @@ class MainView(QMainWindow):
     
     def check_updates_on_startup(self):
         """Check for updates in background on startup"""
+        from PyQt6.QtCore import QThreadPool
         from workers.update_check_worker import UpdateCheckWorker
         
         apt_backend = self.package_manager.get_backend('apt')
@@ -492,8 +493,8 @@ class MainView(QMainWindow):
             return
         
         self.startup_update_worker = UpdateCheckWorker(apt_backend)
-        self.startup_update_worker.finished_signal.connect(self.on_startup_updates_checked)
-        self.startup_update_worker.start()
+        self.startup_update_worker.signals.finished_signal.connect(self.on_startup_updates_checked)
+        QThreadPool.globalInstance().start(self.startup_update_worker)
     
     def on_startup_updates_checked(self, updates):
         """Handle startup update check completion"""
@@ -796,6 +796,8 @@ class MainView(QMainWindow):
     def set_odrs_enabled(self, enabled: bool):
         """Set ODRS enabled setting"""
         self.app_settings.set_odrs_enabled(enabled)
+        from widgets.package_list_item import PackageListItem
+        PackageListItem.refresh_settings()
         # Clear ODRS service to force recreation with new setting
         if hasattr(self, 'odrs_service'):
             delattr(self, 'odrs_service')
@@ -1,5 +1,5 @@
 """Installed packages panel controller"""
-from PyQt6.QtWidgets import QLabel
+from PyQt6.QtWidgets import QLabel, QApplication
 from PyQt6.QtCore import Qt, pyqtSignal
 from .base_panel import BasePanel
 from workers.installed_packages_worker import InstalledPackagesWorker
@@ -14,6 +14,10 @@ class InstalledPanel(BasePanel):
     
     def setup_ui(self):
         """Setup installed panel UI"""
+        self.worker = None
+        # The worker may be parked waiting for an ack; don't leave it blocked at exit
+        QApplication.instance().aboutToQuit.connect(self.stop_worker)
+        
         # Replace scroll area with virtual container
         self.virtual_container = VirtualInstalledContainer()
         self.virtual_container.remove_requested.connect(self.remove_requested.emit)
@@ -43,6 +47,9 @@ class InstalledPanel(BasePanel):
             print("[InstalledPanel] ERROR: APT backend not found")
             return
         
+        # Stop a previous load still waiting on its batches
+        self.stop_worker()
+        
         # Create and start worker
         print("[InstalledPanel] Creating worker thread")
         self.worker = InstalledPackagesWorker(apt_backend, self.lmdb_manager)
@@ -52,17 +59,32 @@ class InstalledPanel(BasePanel):
         print("[InstalledPanel] Starting worker thread")
         self.worker.start()
     
+    def stop_worker(self):
+        """Stop the loading worker and wait for its thread to finish"""
+        if self.worker and self.worker.isRunning():
+            self.worker.stop()
+            self.worker.wait()
+    
     def on_initial_loaded(self, packages):
         """Handle initial batch of packages"""
+        if self.sender() is not self.worker:
+            return  # Queued by a worker that has since been replaced
         print(f"[InstalledPanel] on_initial_loaded() called with {len(packages)} packages")
         self.virtual_container.set_packages(packages)
     
     def on_remaining_loaded(self, packages):
         """Handle remaining batch of packages"""
         print(f"[InstalledPanel] on_remaining_loaded() called with {len(packages)} packages")
+        worker = self.sender()
+        if worker is not self.worker:
+            return  # Stale batch from a replaced worker, which is already stopped
         self.virtual_container.add_packages(packages)
+        # Let the worker load the next batch
+        worker.ack_batch()
     
     def on_error(self, error_message):
         """Handle error loading packages"""
+        if self.sender() is not self.worker:
+            return
         print(f"[InstalledPanel] ERROR: {error_message}")
         self.virtual_container.set_packages([])
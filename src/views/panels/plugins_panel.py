@@ -35,8 +35,8 @@ class PluginsPanel(QWidget):
         """Load and display all plugins"""
         # Clear existing
         layout = self.pluginsLayout
-        while layout.count():
-            child = layout.takeAt(0)
+        for i in reversed(range(layout.count())):
+            child = layout.takeAt(i)
             if child.widget():
                 child.widget().deleteLater()
         
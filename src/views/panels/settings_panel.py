@@ -102,4 +102,6 @@ class SettingsPanel(BasePanel):
     def set_odrs_enabled(self, enabled):
         """Set ODRS enabled setting"""
         self.app_settings.set_odrs_enabled(enabled)
+        from widgets.package_list_item import PackageListItem
+        PackageListItem.refresh_settings()
         self.logger.info(f"ODRS {'enabled' if enabled else 'disabled'}")
@@ -159,8 +159,8 @@ class SettingsPanel(BasePanel):
         """Load backend-specific settings sections in priority order"""
         try:
             layout = self.backendSectionsLayout
-            while layout.count():
-                child = layout.takeAt(0)
+            for i in reversed(range(layout.count())):
+                child = layout.takeAt(i)
                 if child.widget():
                     child.widget().deleteLater()
             
@@ -297,6 +297,8 @@ class SettingsPanel(BasePanel):
     def set_odrs_enabled(self, enabled):
         """Set ODRS enabled setting"""
         self.app_settings.set_odrs_enabled(enabled)
+        from widgets.package_list_item import PackageListItem
+        PackageListItem.refresh_settings()
         self.logger.info(f"ODRS {'enabled' if enabled else 'disabled'}")
     
     def on_update_check_changed(self, enabled):
@@ -1,6 +1,6 @@
 """Updates panel controller"""
 from PyQt6.QtWidgets import QLabel, QSpacerItem, QSizePolicy
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QThreadPool, pyqtSignal
 from .base_panel import BasePanel
 from workers.update_check_worker import UpdateCheckWorker
 from widgets.update_list_item import UpdateListItem
@@ -40,8 +40,8 @@ class UpdatesPanel(BasePanel):
         container_layout = scroll_widget.layout()
         
         # Clear existing items
-        while container_layout.count():
-            item = container_layout.takeAt(0)
+        for i in reversed(range(container_layout.count())):
+            item = container_layout.takeAt(i)
             if item.widget():
                 item.widget().deleteLater()
         
@@ -52,9 +52,9 @@ class UpdatesPanel(BasePanel):
         
         # Create and start worker
         self.worker = UpdateCheckWorker(apt_backend)
-        self.worker.finished_signal.connect(self.on_updates_loaded)
-        self.worker.error_signal.connect(self.on_error)
-        self.worker.start()
+        self.worker.signals.finished_signal.connect(self.on_updates_loaded)
+        self.worker.signals.error_signal.connect(self.on_error)
+        QThreadPool.globalInstance().start(self.worker)
     
     def on_updates_loaded(self, updates):
         """Handle updates loaded from worker"""
@@ -62,8 +62,8 @@ class UpdatesPanel(BasePanel):
         container_layout = scroll_widget.layout()
         
         # Clear loading message
-        while container_layout.count():
-            item = container_layout.takeAt(0)
+        for i in reversed(range(container_layout.count())):
+            item = container_layout.takeAt(i)
             if item.widget():
                 item.widget().deleteLater()
         
@@ -108,8 +108,8 @@ class UpdatesPanel(BasePanel):
         container_layout = scroll_widget.layout()
         
         # Clear loading message
-        while container_layout.count():
-            item = container_layout.takeAt(0)
+        for i in reversed(range(container_layout.count())):
+            item = container_layout.takeAt(i)
             if item.widget():
                 item.widget().deleteLater()
         
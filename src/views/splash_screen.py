@@ -107,6 +107,9 @@ class SplashScreen(QSplashScreen):
     def update_progress(self, value: int, status: str = None, detail: str = None):
         """Update progress bar and status messages
         
+        Repainting is left to the event loop; callers yield back to it
+        between startup steps instead of pumping events here.
+        
         Args:
             value: Progress value (0-100)
             status: Main status message
@@ -119,17 +122,7 @@ class SplashScreen(QSplashScreen):
         
         if detail:
             self.detail_label.setText(detail)
-        
-        # Force repaint
-        self.repaint()
-        
-        # Process events to keep UI responsive
-        from PyQt6.QtWidgets import QApplication
-        QApplication.processEvents()
     
     def set_status(self, message: str):
         """Set status message"""
         self.status_label.setText(message)
-        self.repaint()
-        from PyQt6.QtWidgets import QApplication
-        QApplication.processEvents()
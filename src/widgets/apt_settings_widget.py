@@ -1,8 +1,60 @@
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QTableWidget, 
-                             QTableWidgetItem, QPushButton, QHBoxLayout, QHeaderView)
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QTableView, QAbstractItemView,
+                             QPushButton, QHBoxLayout, QHeaderView)
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PyQt6.QtGui import QFont
+from workers.apt_sources_worker import APTSourcesWorker
+from utils.deb822 import iter_stanzas
 import os
+import sys
+
+
+class SourcesTableModel(QAbstractTableModel):
+    """Table model holding display rows for APT sources"""
+    
+    HEADERS = ("", "URI", "Suite", "Components")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []  # (enabled_mark, uri, suite, components, enabled)
+        self._disabled_font = QFont()
+        self._disabled_font.setItalic(True)
+    
+    def set_sources(self, sources):
+        """Replace all rows with a single model reset"""
+        self.beginResetModel()
+        self._rows = [(
+            "✓" if source['enabled'] else "✗",
+            source.get('uri', ''),
+            source.get('suite', '').replace(' ', '\n'),
+            source.get('components', '').replace(' ', '\n'),
+            source['enabled']
+        ) for source in sources]
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row[index.column()]
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() == 0:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.FontRole and not row[4]:
+            # Gray out disabled rows
+            return self._disabled_font
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
 
 class APTSettingsWidget(QWidget):
     """Settings widget for APT backend showing package sources"""
@@ -10,6 +62,7 @@ class APTSettingsWidget(QWidget):
     def __init__(self, parent=None, logging_service=None):
         super().__init__(parent)
         self.logger = logging_service.get_logger('apt_settings') if logging_service else None
+        self.sources_worker = None
         self.setup_ui()
         self.load_sources()
     
@@ -30,16 +83,16 @@ class APTSettingsWidget(QWidget):
         layout.addWidget(desc)
         
         # Sources table
-        self.sources_table = QTableWidget()
-        self.sources_table.setColumnCount(4)
-        self.sources_table.setHorizontalHeaderLabels(["", "URI", "Suite", "Components"])
+        self.sources_model = SourcesTableModel(self)
+        self.sources_table = QTableView()
+        self.sources_table.setModel(self.sources_model)
         self.sources_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
         self.sources_table.setColumnWidth(0, 30)
         self.sources_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         self.sources_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
         self.sources_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        self.sources_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.sources_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.sources_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.sources_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.sources_table.setWordWrap(True)
         self.sources_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
         layout.addWidget(self.sources_table)
@@ -53,39 +106,30 @@ class APTSettingsWidget(QWidget):
         layout.addLayout(button_layout)
     
     def load_sources(self):
-        """Load APT sources from system files"""
-        sources = self._parse_sources()
-        self.sources_table.setRowCount(len(sources))
+        """Load APT sources from system files in a background thread"""
+        if self.sources_worker and self.sources_worker.isRunning():
+            return
         
-        for row, source in enumerate(sources):
-            # Enabled column
-            enabled_item = QTableWidgetItem("✓" if source['enabled'] else "✗")
-            enabled_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.sources_table.setItem(row, 0, enabled_item)
-            
-            # URI column
-            uri_item = QTableWidgetItem(source.get('uri', ''))
-            self.sources_table.setItem(row, 1, uri_item)
-            
-            # Suite column
-            suite_item = QTableWidgetItem(source.get('suite', '').replace(' ', '\n'))
-            self.sources_table.setItem(row, 2, suite_item)
-            
-            # Components column
-            components_item = QTableWidgetItem(source.get('components', '').replace(' ', '\n'))
-            self.sources_table.setItem(row, 3, components_item)
-            
-            # Gray out disabled rows
-            if not source['enabled']:
-                for col in range(4):
-                    item = self.sources_table.item(row, col)
-                    font = item.font()
-                    font.setItalic(True)
-                    item.setFont(font)
+        self.refresh_btn.setEnabled(False)
+        self.sources_worker = APTSourcesWorker(self._parse_sources)
+        self.sources_worker.finished_signal.connect(self.on_sources_loaded)
+        self.sources_worker.error_signal.connect(self.on_sources_error)
+        self.sources_worker.start()
+    
+    def on_sources_loaded(self, sources):
+        """Show parsed sources"""
+        self.sources_model.set_sources(sources)
+        self.refresh_btn.setEnabled(True)
         
         if self.logger:
             self.logger.info(f"Loaded {len(sources)} APT sources")
     
+    def on_sources_error(self, error_message):
+        """Handle source loading failure"""
+        self.refresh_btn.setEnabled(True)
+        if self.logger:
+            self.logger.error(f"Failed to load APT sources: {error_message}")
+    
     def _parse_sources(self):
         """Parse APT sources from files"""
         sources = []
@@ -140,13 +184,15 @@ class APTSettingsWidget(QWidget):
                         suite = parts[2]
                         components = ' '.join(parts[3:]) if len(parts) > 3 else ''
                         
+                        # Suites, components and URI hosts repeat across
+                        # many entries; intern them to share storage
                         sources.append({
-                            'file': filepath,
+                            'file': sys.intern(filepath),
                             'line': line_num,
                             'enabled': enabled,
-                            'uri': uri,
-                            'suite': suite,
-                            'components': components,
+                            'uri': sys.intern(uri),
+                            'suite': sys.intern(suite),
+                            'components': sys.intern(components),
                             'raw': line
                         })
         except Exception as e:
@@ -159,50 +205,40 @@ class APTSettingsWidget(QWidget):
         sources = []
         try:
             with open(filepath, 'r') as f:
-                content = f.read()
-            
-            # Split into stanzas (separated by blank lines)
-            stanzas = content.split('\n\n')
-            
-            for stanza in stanzas:
-                if not stanza.strip():
-                    continue
-                
-                fields = {}
-                has_field = False
-                all_fields_commented = True
-                
-                for line in stanza.split('\n'):
-                    line = line.strip()
-                    if not line:
-                        continue
+                for stanza_lines in iter_stanzas(f):
+                    fields = {}
+                    has_field = False
+                    all_fields_commented = True
                     
-                    # Skip pure comment lines (no colon)
-                    if line.startswith('#'):
-                        if ':' not in line:
-                            continue
-                        # Field line is commented
-                        line = line.lstrip('#').strip()
-                    else:
-                        # Found at least one uncommented field
+                    for line in stanza_lines:
+                        line = line.strip()
+                        
+                        # Skip pure comment lines (no colon)
+                        if line.startswith('#'):
+                            if ':' not in line:
+                                continue
+                            # Field line is commented
+                            line = line.lstrip('#').strip()
+                        else:
+                            # Found at least one uncommented field
+                            if ':' in line:
+                                all_fields_commented = False
+                        
                         if ':' in line:
-                            all_fields_commented = False
+                            has_field = True
+                            key, value = line.split(':', 1)
+                            fields[key.strip()] = value.strip()
                     
-                    if ':' in line:
-                        has_field = True
-                        key, value = line.split(':', 1)
-                        fields[key.strip()] = value.strip()
-                
-                if has_field and 'Types' in fields and 'URIs' in fields:
-                    sources.append({
-                        'file': filepath,
-                        'line': 1,
-                        'enabled': not all_fields_commented,
-                        'uri': fields.get('URIs', ''),
-                        'suite': fields.get('Suites', ''),
-                        'components': fields.get('Components', ''),
-                        'raw': stanza
-                    })
+                    if has_field and 'Types' in fields and 'URIs' in fields:
+                        sources.append({
+                            'file': sys.intern(filepath),
+                            'line': 1,
+                            'enabled': not all_fields_commented,
+                            'uri': sys.intern(fields.get('URIs', '')),
+                            'suite': sys.intern(fields.get('Suites', '')),
+                            'components': sys.intern(fields.get('Components', '')),
+                            'raw': ''.join(stanza_lines).rstrip('\n')
+                        })
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Error parsing {filepath}: {e}")
@@ -1,7 +1,37 @@
 """Backend preference list item widget with enable checkbox and drag handle"""
-from PyQt6.QtWidgets import QWidget, QHBoxLayout, QCheckBox, QLabel, QToolTip
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QCheckBox, QLabel, QToolTip, QApplication
 from PyQt6.QtCore import pyqtSignal, Qt, QPoint
-from PyQt6.QtGui import QCursor
+from PyQt6.QtGui import QCursor, QIcon, QPixmap, QPainter, QColor, QPalette, QFont
+
+ICON_SIZE = 16
+
+# Rendered icon pixmaps shared by all items, keyed by theme icon name
+_icon_pixmaps = {}
+
+
+def _get_icon_pixmap(theme_name, fallback_text, fallback_color=None):
+    """Get a cached pixmap for a theme icon
+    
+    Falls back to painting the glyph once when the icon theme lacks the icon,
+    so rows never shape emoji text themselves.
+    """
+    pixmap = _icon_pixmaps.get(theme_name)
+    if pixmap is None:
+        icon = QIcon.fromTheme(theme_name)
+        if not icon.isNull():
+            pixmap = icon.pixmap(ICON_SIZE, ICON_SIZE)
+        else:
+            pixmap = QPixmap(ICON_SIZE, ICON_SIZE)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            font = QFont()
+            font.setPixelSize(ICON_SIZE - 2)
+            painter = QPainter(pixmap)
+            painter.setFont(font)
+            painter.setPen(fallback_color or QApplication.palette().color(QPalette.ColorRole.Mid))
+            painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, fallback_text)
+            painter.end()
+        _icon_pixmaps[theme_name] = pixmap
+    return pixmap
 
 
 class BackendPreferenceItem(QWidget):
@@ -19,8 +49,8 @@ class BackendPreferenceItem(QWidget):
         layout.setSpacing(10)
         
         # Drag handle icon
-        drag_icon = QLabel("☰")
-        drag_icon.setStyleSheet("font-size: 16px; color: palette(mid);")
+        drag_icon = QLabel()
+        drag_icon.setPixmap(_get_icon_pixmap('view-list', "☰"))
         layout.addWidget(drag_icon)
         
         # Enable checkbox with version
@@ -35,15 +65,17 @@ class BackendPreferenceItem(QWidget):
         # Status icon
         if status and (status.get('missing_system_deps') or status.get('missing_python_deps')):
             # Warning icon for issues
-            self.status_icon = QLabel("⚠")
-            self.status_icon.setStyleSheet("font-size: 16px; color: #FFA500; padding-right: 5px;")
+            self.status_icon = QLabel()
+            self.status_icon.setPixmap(_get_icon_pixmap('dialog-warning', "⚠", QColor("#FFA500")))
+            self.status_icon.setContentsMargins(0, 0, 5, 0)
             self.status_icon.setCursor(Qt.CursorShape.PointingHandCursor)
             self.status_icon.mousePressEvent = self.show_warning_tooltip
             layout.addWidget(self.status_icon)
         else:
             # Info icon for healthy plugins
-            self.status_icon = QLabel("ⓘ")
-            self.status_icon.setStyleSheet("font-size: 16px; color: palette(mid); padding-right: 5px;")
+            self.status_icon = QLabel()
+            self.status_icon.setPixmap(_get_icon_pixmap('dialog-information', "ⓘ"))
+            self.status_icon.setContentsMargins(0, 0, 5, 0)
             self.status_icon.setCursor(Qt.CursorShape.PointingHandCursor)
             self.status_icon.mousePressEvent = self.show_info_tooltip
             layout.addWidget(self.status_icon)
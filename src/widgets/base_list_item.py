@@ -1,10 +1,138 @@
 """Base list item widget with standardized styling"""
-from PyQt6.QtWidgets import QFrame
+from PyQt6.QtWidgets import QFrame, QApplication
 from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QFontMetrics, QPixmap, QPainter
 from PyQt6 import uic
 from utils.path_resolver import PathResolver
 
 
+# Stylesheet for every list item form, installed once on the application so
+# items don't each parse their own. The frame rule also matches the QFrame
+# based children (labels), which the objectName rules below then override.
+_FRAME_STYLE_TEMPLATE = """
+    BaseListItem, BaseListItem QFrame {{
+        background-color: palette(button);
+        border: {border};
+        border-radius: 8px;
+        padding: 8px;
+        margin: 4px;
+    }}
+    BaseListItem:hover, BaseListItem QFrame:hover {{
+        background-color: palette(alternate-base);
+    }}
+"""
+
+_CHILD_STYLE = """
+    BaseListItem QLabel#iconLabel {
+        background-color: palette(button);
+        border-radius: 8px;
+    }
+    BaseListItem QLabel#iconLabel[security="true"] {
+        background-color: rgba(255, 107, 107, 0.2);
+    }
+    BaseListItem QLabel#nameLabel, BaseListItem QLabel#descLabel {
+        color: palette(window-text);
+        background: transparent;
+        border: none;
+        padding: 0px;
+    }
+    BaseListItem QLabel#ratingStarsLabel, BaseListItem QLabel#ratingEmptyLabel,
+    BaseListItem QLabel#ratingLabel, BaseListItem QLabel#infoLabel,
+    BaseListItem QLabel#currentVersionLabel, BaseListItem QLabel#versionArrowLabel,
+    BaseListItem QLabel#newVersionLabel {
+        background: transparent;
+        border: none;
+        padding: 0px;
+    }
+    BaseListItem QLabel#ratingStarsLabel {
+        color: #FFD700;
+    }
+    BaseListItem QLabel#ratingEmptyLabel {
+        color: #B8860B;
+    }
+    BaseListItem QLabel#currentVersionLabel {
+        color: palette(mid);
+    }
+    BaseListItem QLabel#versionArrowLabel {
+        color: palette(window-text);
+    }
+    BaseListItem QLabel#newVersionLabel {
+        color: palette(highlight);
+    }
+    BaseListItem QLabel#backendLabel {
+        color: palette(window-text);
+        background: transparent;
+        border: none;
+        padding: 2px;
+    }
+    BaseListItem QLabel#securityLabel {
+        color: #FF6B6B;
+        background: transparent;
+        border: none;
+        padding: 2px;
+    }
+    BaseListItem QPushButton#installButton, BaseListItem QPushButton#updateButton {
+        background-color: palette(highlight);
+        color: palette(highlighted-text);
+        border: none;
+        border-radius: 6px;
+    }
+    BaseListItem QPushButton#installButton:hover, BaseListItem QPushButton#updateButton:hover {
+        background-color: palette(dark);
+    }
+    BaseListItem QPushButton#removeButton {
+        background-color: #FF6B6B;
+        color: white;
+        border: none;
+        border-radius: 6px;
+    }
+    BaseListItem QPushButton#removeButton:hover {
+        background-color: #FF5252;
+    }
+"""
+
+_STYLE_NORMAL = _FRAME_STYLE_TEMPLATE.format(border="2px solid palette(mid)") + _CHILD_STYLE
+_STYLE_DEV = (_FRAME_STYLE_TEMPLATE.format(border="1px solid red")
+              + _CHILD_STYLE.replace("border: none;", "border: 1px solid red;"))
+
+# Font metrics of the description label, shared by every item
+_DESC_METRICS = None
+
+# Icon glyphs rendered to pixmaps once, keyed by glyph
+_ICON_PIXMAPS = {}
+
+# Whether the dev outline is enabled, set by install_style_sheet()
+_DEV_OUTLINE = False
+
+
+def _icon_pixmap(glyph, font):
+    """Get a shared pixmap of an icon glyph, rendering it on first use"""
+    pixmap = _ICON_PIXMAPS.get(glyph)
+    if pixmap is None:
+        metrics = QFontMetrics(font)
+        size = max(metrics.height(), metrics.horizontalAdvance(glyph))
+        ratio = QApplication.instance().devicePixelRatio()
+        pixmap = QPixmap(round(size * ratio), round(size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        painter.drawText(0, 0, size, size, Qt.AlignmentFlag.AlignCenter, glyph)
+        painter.end()
+        _ICON_PIXMAPS[glyph] = pixmap
+    return pixmap
+
+
+def install_style_sheet(app, dev_outline=False):
+    """Set the application stylesheet: list item rules plus the optional dev outline"""
+    global _DEV_OUTLINE
+    _DEV_OUTLINE = dev_outline
+    if dev_outline:
+        app.setStyleSheet("* { border: 1px solid red; }" + _STYLE_DEV)
+    else:
+        app.setStyleSheet(_STYLE_NORMAL)
+
+
 class BaseListItem(QFrame):
     """Base class for all list item widgets with consistent styling"""
     
@@ -16,15 +144,36 @@ class BaseListItem(QFrame):
     BUTTON_WIDTH = 80
     BUTTON_HEIGHT = 32
     
+    # Default icon glyph, shown as a pre-rendered pixmap
+    ICON_GLYPH = '📦'
+    
+    # Descriptions are elided to about two wrapped lines before layout
+    DESC_ELIDE_WIDTH = 800
+    
     # Standard colors
     COLOR_SECURITY = "#FF6B6B"
     COLOR_SECURITY_BG = "rgba(255, 107, 107, 0.1)"
     
+    # Compiled form classes, keyed by ui file
+    _form_classes = {}
+    
     def __init__(self, ui_file, parent=None):
         super().__init__(parent)
-        uic.loadUi(PathResolver.get_ui_path(ui_file), self)
+        self._setup_form(ui_file)
         self._apply_base_styling()
     
+    def _setup_form(self, ui_file):
+        """Build the widget tree from a form class compiled once per ui file"""
+        form_class = BaseListItem._form_classes.get(ui_file)
+        if form_class is None:
+            form_class, _ = uic.loadUiType(PathResolver.get_ui_path(ui_file))
+            BaseListItem._form_classes[ui_file] = form_class
+        
+        form = form_class()
+        form.setupUi(self)
+        # Expose child widgets on self the same way uic.loadUi does
+        self.__dict__.update(vars(form))
+    
     def mouseDoubleClickEvent(self, event):
         """Handle double click"""
         self.double_clicked.emit()
@@ -35,49 +184,28 @@ class BaseListItem(QFrame):
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         self.setFixedHeight(self.ITEM_HEIGHT)
         
-        # Check if dev outline is active
-        from PyQt6.QtWidgets import QApplication
-        app_stylesheet = QApplication.instance().styleSheet()
-        self.dev_outline = "border: 1px solid red" in app_stylesheet
+        self.dev_outline = _DEV_OUTLINE
         
-        # Apply base frame style
-        self._set_frame_style()
+        # Show the icon from a shared pixmap instead of shaping emoji text
+        self._set_icon(self.ICON_GLYPH)
         
         # Make labels transparent for mouse events
         self._set_labels_transparent()
     
-    def _set_frame_style(self, border_color="palette(mid)", bg_color="palette(button)", bg_hover="palette(alternate-base)"):
-        """Set frame style with optional custom colors"""
-        if self.dev_outline:
-            border = "1px solid red"
-        else:
-            border = f"2px solid {border_color}"
-        
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {bg_color};
-                border: {border};
-                border-radius: 8px;
-                padding: 8px;
-                margin: 4px;
-            }}
-            QFrame:hover {{
-                background-color: {bg_hover};
-            }}
-        """)
+    def _set_icon(self, glyph):
+        """Show an icon glyph from a pixmap shared by all items"""
+        self.iconLabel.setPixmap(_icon_pixmap(glyph, self.iconLabel.font()))
+    
+    def _set_description(self, text):
+        """Set description text, elided before the label lays it out"""
+        global _DESC_METRICS
+        if _DESC_METRICS is None:
+            _DESC_METRICS = QFontMetrics(self.descLabel.font())
+        self.descLabel.setText(_DESC_METRICS.elidedText(
+            text or "", Qt.TextElideMode.ElideRight, self.DESC_ELIDE_WIDTH))
     
     def _set_labels_transparent(self):
         """Make all labels transparent for mouse events"""
         for child in self.findChildren(type(self.nameLabel)):
             if child.objectName() != 'iconLabel':
                 child.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
-    
-    def _apply_dev_outline(self, *widgets):
-        """Apply dev outline to specified widgets"""
-        if self.dev_outline:
-            for widget in widgets:
-                current_style = widget.styleSheet()
-                if "border: none" in current_style:
-                    widget.setStyleSheet(current_style.replace("border: none;", "border: 1px solid red;"))
-                else:
-                    widget.setStyleSheet(current_style + "; border: 1px solid red;")
@@ -1,43 +1,138 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextEdit, QMenu, QApplication
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QMenu, QApplication
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QFont, QPalette
+import weakref
+
+
+MESSAGE_LABEL_STYLE = "QLabel { background: transparent; }"
+
+_MONO_FONT = None
+
+
+def _get_mono_font():
+    """Get the shared monospace font for data sections"""
+    global _MONO_FONT
+    if _MONO_FONT is None:
+        _MONO_FONT = QFont("Consolas", 9)
+        _MONO_FONT.setStyleHint(QFont.StyleHint.Monospace)
+    return _MONO_FONT
+
+
+class _ThemeState:
+    """Palette-derived colors shared by every ExpandableItem
+    
+    Read from the application palette on first access and dropped again
+    when the palette changes, which is the only time they can go stale.
+    """
+    
+    def __init__(self):
+        self._values = None
+        self._connected = False
+    
+    def _get(self, key):
+        if self._values is None:
+            self._load()
+        return self._values[key]
+    
+    def _load(self):
+        app = QApplication.instance()
+        palette = app.palette()
+        is_dark = palette.color(QPalette.ColorRole.Window).lightness() < 128
+        alternate_base = palette.color(QPalette.ColorRole.AlternateBase)
+        self._values = {
+            'is_dark': is_dark,
+            'bg_normal': alternate_base.darker(110 if is_dark else 105).name(),
+            'bg_selected': palette.color(QPalette.ColorRole.Highlight).name(),
+            'text_selected': palette.color(QPalette.ColorRole.HighlightedText).name(),
+            'data_bg_color': "rgba(42, 42, 42, 0.7)" if is_dark else "rgba(245, 245, 245, 0.7)",
+        }
+        
+        if not self._connected:
+            palette_changed = getattr(app, 'paletteChanged', None)
+            if palette_changed is not None:
+                palette_changed.connect(self.invalidate)
+            self._connected = True
+    
+    def invalidate(self, *args):
+        """Forget cached colors and styles after a theme change and restyle live items"""
+        self._values = None
+        ExpandableItem._styles_computed = False
+        ExpandableItem._compute_styles()
+        for item in list(ExpandableItem._live_items):
+            try:
+                item._refresh_theme()
+            except RuntimeError:
+                # The C++ widget is already gone
+                pass
+    
+    @property
+    def is_dark(self):
+        return self._get('is_dark')
+    
+    @property
+    def bg_normal(self):
+        return self._get('bg_normal')
+    
+    @property
+    def bg_selected(self):
+        return self._get('bg_selected')
+    
+    @property
+    def text_selected(self):
+        return self._get('text_selected')
+    
+    @property
+    def data_bg_color(self):
+        return self._get('data_bg_color')
+
+
+_theme = _ThemeState()
+
 
 class ExpandableItem(QWidget):
     """Reusable expandable item widget with collapsible content section"""
     
     selection_changed = pyqtSignal(object)  # Signal when this item is selected
+    expanded_changed = pyqtSignal(object, bool)  # Signal when the data section opens or closes
     
     # Class-level style cache
     _styles_computed = False
     _cached_styles = {}
+    # Items to restyle when the palette changes
+    _live_items = weakref.WeakSet()
+    
+    # Per-item state defaults; an instance only stores its own value once it
+    # diverges, which keeps the common never-touched log entry small
+    is_expanded = False
+    is_selected = False
+    data_widget = None
+    _cached_data_height = None
+    _selection_parent_ref = None
+    _last_applied_style = None
+    _last_label_style = None
+    _style_table = None
+    
+    # Process-wide clipboard, looked up on first copy
+    _clipboard = None
+    
+    @classmethod
+    def _get_clipboard(cls):
+        """Get the application clipboard, cached on the class"""
+        if cls._clipboard is None:
+            cls._clipboard = QApplication.clipboard()
+        return cls._clipboard
     
     @classmethod
     def _compute_styles(cls):
-        """Compute and cache all styles once"""
-        if cls._styles_computed:
+        """Compute and cache all styles once per application palette"""
+        if cls._styles_computed or not QApplication.instance():
             return
         
-        from PyQt6.QtWidgets import QApplication
-        app = QApplication.instance()
-        if not app:
-            return
-        
-        palette = app.palette()
-        is_dark = palette.color(palette.ColorRole.Window).lightness() < 128
-        
-        if is_dark:
-            bg_normal = palette.color(palette.ColorRole.AlternateBase).darker(110).name()
-            bg_selected = palette.color(palette.ColorRole.Highlight).name()
-            text_selected = palette.color(palette.ColorRole.HighlightedText).name()
-        else:
-            bg_normal = palette.color(palette.ColorRole.AlternateBase).darker(105).name()
-            bg_selected = palette.color(palette.ColorRole.Highlight).name()
-            text_selected = palette.color(palette.ColorRole.HighlightedText).name()
-        
         cls._cached_styles = {
-            'normal': f"ExpandableItem {{ background-color: {bg_normal}; border-radius: 3px; }}",
-            'selected': f"ExpandableItem {{ background-color: {bg_selected}; border-radius: 3px; }}",
-            'text_selected': text_selected
+            'normal': f"ExpandableItem {{ background-color: {_theme.bg_normal}; border-radius: 3px; }}",
+            'selected': f"ExpandableItem {{ background-color: {_theme.bg_selected}; border-radius: 3px; }}",
+            'text_selected': _theme.text_selected,
+            'data_widget': f"QLabel {{ background-color: {_theme.data_bg_color}; border: 1px solid rgba(136, 136, 136, 0.5); }}"
         }
         cls._styles_computed = True
     
@@ -46,12 +141,11 @@ class ExpandableItem(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         self.message = message
         self.data = data
-        self.is_expanded = False
-        self.is_selected = False
         self.message_color = color
         
         # Ensure styles are computed
         self._compute_styles()
+        ExpandableItem._live_items.add(self)
         
         self.setup_ui()
         # Don't call update_appearance() here - let Qt handle initial styling
@@ -65,19 +159,14 @@ class ExpandableItem(QWidget):
         header_layout = QHBoxLayout()
         header_layout.setContentsMargins(5, 2, 5, 2)
         
-        # Expand/collapse button
-        self.expand_button = QPushButton()
+        # Expand/collapse indicator, clicks are handled in mousePressEvent
+        self.expand_button = QLabel()
         self.expand_button.setFixedSize(16, 16)
-        self.expand_button.setFlat(True)
-        self.expand_button.setStyleSheet("QPushButton { border: none; }")
-        self.expand_button.clicked.connect(self.toggle_expanded)
+        self.expand_button.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         if self.data:
             self.expand_button.setText("▶")
             self.expand_button.setToolTip("Click to expand data")
-        else:
-            self.expand_button.setText(" ")
-            self.expand_button.setEnabled(False)
         
         header_layout.addWidget(self.expand_button)
         
@@ -88,53 +177,88 @@ class ExpandableItem(QWidget):
         
         layout.addLayout(header_layout)
         
-        # Data section (initially hidden)
-        if self.data:
-            self.data_widget = QTextEdit()
-            self.data_widget.setPlainText(self.data)
-            self.data_widget.setReadOnly(True)
-            self.data_widget.setMaximumHeight(0)  # Start collapsed
-            
-            # Use monospace font for JSON
-            font = QFont("Consolas", 9)
-            font.setStyleHint(QFont.StyleHint.Monospace)
-            self.data_widget.setFont(font)
-            
-            # Set partial opacity background for data section
-            palette = self.palette()
-            is_dark = palette.color(palette.ColorRole.Window).lightness() < 128
-            if is_dark:
-                data_bg_color = "rgba(42, 42, 42, 0.7)"  # Semi-transparent dark gray
-            else:
-                data_bg_color = "rgba(245, 245, 245, 0.7)"  # Semi-transparent light gray
-            self.data_widget.setStyleSheet(f"QTextEdit {{ background-color: {data_bg_color}; border: 1px solid rgba(136, 136, 136, 0.5); }}")
-            
-            layout.addWidget(self.data_widget)
+        # Data section is created on first expand; most items never expand
+    
+    def rebind(self, message: str, data: str = None, color=None):
+        """Show another entry in this widget without rebuilding it"""
+        self.message = message
+        self.data = data
+        self.message_label.setText(message)
+        
+        if data:
+            self.expand_button.setText("▶")
+            self.expand_button.setToolTip("Click to expand data")
         else:
-            self.data_widget = None
+            self.expand_button.setText("")
+            self.expand_button.setToolTip("")
+        
+        # Collapse, and measure the new data again on its first expand
+        self.is_expanded = False
+        if self.data_widget is not None:
+            self.data_widget.setVisible(False)
+            self.data_widget.setText(data or "")
+            self._cached_data_height = None
+        
+        self.is_selected = False
+        self.message_color = color
+        self._style_table = None
+        # Items that were never styled keep Qt's initial styling, like new ones
+        if self._last_applied_style is not None:
+            self.update_appearance()
+    
+    def _create_data_widget(self):
+        """Create the read-only data section"""
+        self.data_widget = QLabel(self.data)
+        self.data_widget.setTextFormat(Qt.TextFormat.PlainText)
+        self.data_widget.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.data_widget.setWordWrap(True)
+        self.data_widget.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self.data_widget.setVisible(False)  # Start collapsed, out of the layout
+        
+        # Use monospace font for JSON
+        self.data_widget.setFont(_get_mono_font())
+        
+        # Set partial opacity background for data section
+        self.data_widget.setStyleSheet(self._cached_styles['data_widget'])
+        
+        self.layout().addWidget(self.data_widget)
     
     def toggle_expanded(self):
         """Toggle the expanded state of the data section"""
-        if not self.data_widget:
+        if not self.data:
             return
         
+        if self.data_widget is None:
+            self._create_data_widget()
+        
         self.is_expanded = not self.is_expanded
         
         if self.is_expanded:
             self.expand_button.setText("▼")
             self.expand_button.setToolTip("Click to collapse data")
-            # Calculate height needed for data
-            doc_height = self.data_widget.document().size().height()
-            target_height = min(int(doc_height) + 10, 200)  # Max 200px
-            self.data_widget.setMaximumHeight(target_height)
+            # Data never changes, so measure the height only on first expand
+            if self._cached_data_height is None:
+                content_height = self.data_widget.heightForWidth(self.width())
+                if content_height < 0:
+                    content_height = self.data_widget.sizeHint().height()
+                self._cached_data_height = min(content_height + 10, 200)  # Max 200px
+                self.data_widget.setMaximumHeight(self._cached_data_height)
+            self.data_widget.setVisible(True)
         else:
             self.expand_button.setText("▶")
             self.expand_button.setToolTip("Click to expand data")
-            self.data_widget.setMaximumHeight(0)
+            self.data_widget.setVisible(False)
+        
+        self.expanded_changed.emit(self, self.is_expanded)
     
     def mousePressEvent(self, event):
         """Handle mouse press for selection and context menu"""
         if event.button() == Qt.MouseButton.LeftButton:
+            if self.data and self.expand_button.geometry().contains(event.position().toPoint()):
+                self.toggle_expanded()
+                event.accept()
+                return
+            
             # Check if Ctrl is held for multi-selection
             modifiers = event.modifiers()
             if modifiers & Qt.KeyboardModifier.ControlModifier:
@@ -154,33 +278,36 @@ class ExpandableItem(QWidget):
         # This will be handled by the log view's on_item_selected method
         pass
     
-
-    
     def show_context_menu(self, position):
         """Show context menu for copying"""
         # Get parent virtual container to check for multiple selections
-        parent_widget = self.parent()
-        while parent_widget and not hasattr(parent_widget, 'get_selected_widgets'):
-            parent_widget = parent_widget.parent()
+        parent_widget = self._selection_parent_ref() if self._selection_parent_ref else None
+        if parent_widget is None:
+            parent_widget = self.parent()
+            while parent_widget and not hasattr(parent_widget, 'get_selected_entries'):
+                parent_widget = parent_widget.parent()
+            if parent_widget:
+                self._selection_parent_ref = weakref.ref(parent_widget)
         
         menu = QMenu(self)
         
         if parent_widget:
-            selected_widgets = parent_widget.get_selected_widgets()
-            if len(selected_widgets) > 1:
+            # Includes selected entries scrolled out of view, which have no widget
+            selected_entries = parent_widget.get_selected_entries()
+            if len(selected_entries) > 1:
                 # Multiple items selected
-                count = len(selected_widgets)
+                count = len(selected_entries)
                 copy_text_action = menu.addAction(f"Copy Text ({count} items)")
-                copy_text_action.triggered.connect(lambda: self.copy_multiple_text(selected_widgets))
+                copy_text_action.triggered.connect(lambda: self.copy_multiple_text(selected_entries))
                 
                 # Check if any selected items have data
-                has_data = any(item.data for item in selected_widgets)
+                has_data = any(data for _, _, data in selected_entries)
                 if has_data:
                     copy_data_action = menu.addAction(f"Copy Data ({count} items)")
-                    copy_data_action.triggered.connect(lambda: self.copy_multiple_data(selected_widgets))
+                    copy_data_action.triggered.connect(lambda: self.copy_multiple_data(selected_entries))
                     
                     copy_both_action = menu.addAction(f"Copy Both ({count} items)")
-                    copy_both_action.triggered.connect(lambda: self.copy_multiple_both(selected_widgets))
+                    copy_both_action.triggered.connect(lambda: self.copy_multiple_both(selected_entries))
             else:
                 # Single item (this item)
                 copy_text_action = menu.addAction("Copy Text")
@@ -197,74 +324,45 @@ class ExpandableItem(QWidget):
     
     def copy_text(self):
         """Copy message text to clipboard"""
-        clipboard = QApplication.clipboard()
-        clipboard.setText(self.message)
+        self._get_clipboard().setText(self.message)
     
     def copy_data(self):
         """Copy data to clipboard"""
         if self.data:
-            clipboard = QApplication.clipboard()
-            clipboard.setText(self.data)
+            self._get_clipboard().setText(self.data)
     
     def copy_both(self):
         """Copy both message and data to clipboard"""
         if self.data:
-            combined = f"{self.message}\n\nData:\n{self.data}"
-            clipboard = QApplication.clipboard()
-            clipboard.setText(combined)
-    
-    def copy_multiple_text(self, items):
-        """Copy text from multiple items with separators"""
-        texts = []
-        for i, item in enumerate(items):
-            if i > 0:
-                prev_item = items[i-1]
-                if item.parent() and prev_item.parent():
-                    current_pos = item.parent().layout().indexOf(item)
-                    prev_pos = prev_item.parent().layout().indexOf(prev_item)
-                    if current_pos - prev_pos > 1:
-                        texts.append("...")
-            texts.append(item.message)
-        
-        clipboard = QApplication.clipboard()
-        clipboard.setText("\n".join(texts))
-    
-    def copy_multiple_data(self, items):
-        """Copy data from multiple items with separators"""
-        texts = []
-        for i, item in enumerate(items):
-            if item.data:
-                if i > 0:
-                    prev_item = items[i-1]
-                    if item.parent() and prev_item.parent():
-                        current_pos = item.parent().layout().indexOf(item)
-                        prev_pos = prev_item.parent().layout().indexOf(prev_item)
-                        if current_pos - prev_pos > 1:
-                            texts.append("...")
-                texts.append(item.data)
-        
-        clipboard = QApplication.clipboard()
-        clipboard.setText("\n".join(texts))
-    
-    def copy_multiple_both(self, items):
-        """Copy both text and data from multiple items with separators"""
-        texts = []
-        for i, item in enumerate(items):
-            if i > 0:
-                prev_item = items[i-1]
-                if item.parent() and prev_item.parent():
-                    current_pos = item.parent().layout().indexOf(item)
-                    prev_pos = prev_item.parent().layout().indexOf(prev_item)
-                    if current_pos - prev_pos > 1:
-                        texts.append("...")
-            texts.append(item.message)
-            if item.data:
-                texts.append(item.data)
-        
-        clipboard = QApplication.clipboard()
-        clipboard.setText("\n".join(texts))
+            self._get_clipboard().setText(f"{self.message}\n\nData:\n{self.data}")
     
-
+    @staticmethod
+    def _iter_with_gaps(entries, include_message=True, include_data=False):
+        """Yield clipboard lines for (index, message, data) entries, with "..." between non-adjacent rows"""
+        prev_index = None
+        for index, message, data in entries:
+            gap = prev_index is not None and index - prev_index > 1
+            prev_index = index
+            if not include_message and not data:
+                continue
+            if gap:
+                yield "..."
+            if include_message:
+                yield message
+            if include_data and data:
+                yield data
+    
+    def copy_multiple_text(self, entries):
+        """Copy text from multiple entries with separators"""
+        self._get_clipboard().setText("\n".join(self._iter_with_gaps(entries)))
+    
+    def copy_multiple_data(self, entries):
+        """Copy data from multiple entries with separators"""
+        self._get_clipboard().setText("\n".join(self._iter_with_gaps(entries, include_message=False, include_data=True)))
+    
+    def copy_multiple_both(self, entries):
+        """Copy both text and data from multiple entries with separators"""
+        self._get_clipboard().setText("\n".join(self._iter_with_gaps(entries, include_data=True)))
     
     def set_selected(self, selected: bool):
         """Set selection state"""
@@ -272,23 +370,45 @@ class ExpandableItem(QWidget):
             self.is_selected = selected
             self.update_appearance()
     
+    def _build_style_table(self):
+        """Map is_selected to the (item, label) stylesheet pair for this item"""
+        if self.message_color:
+            label_style = f"QLabel {{ color: {self.message_color.name()}; background: transparent; }}"
+        else:
+            label_style = MESSAGE_LABEL_STYLE
+        selected_label_style = f"QLabel {{ color: {self._cached_styles['text_selected']}; background: transparent; }}"
+        return {
+            False: (self._cached_styles['normal'], label_style),
+            True: (self._cached_styles['selected'], selected_label_style),
+        }
+    
     def update_appearance(self):
         """Update widget appearance based on selection state"""
-        if self.is_selected:
-            self.setStyleSheet(self._cached_styles['selected'])
-            text_color = self._cached_styles['text_selected']
-        else:
-            self.setStyleSheet(self._cached_styles['normal'])
-            text_color = self.message_color.name() if self.message_color else None
+        if self._style_table is None:
+            self._style_table = self._build_style_table()
+        style, label_style = self._style_table[self.is_selected]
         
-        if text_color:
-            self.message_label.setStyleSheet(f"QLabel {{ color: {text_color}; background: transparent; }}")
-        else:
-            self.message_label.setStyleSheet("QLabel { background: transparent; }")
+        # Re-applying an identical stylesheet still re-polishes the widget tree
+        if style != self._last_applied_style:
+            self.setStyleSheet(style)
+            self._last_applied_style = style
+        if label_style != self._last_label_style:
+            self.message_label.setStyleSheet(label_style)
+            self._last_label_style = label_style
+    
+    def _refresh_theme(self):
+        """Re-apply the cached styles after they were recomputed for a new palette"""
+        self._style_table = None
+        if self.data_widget is not None:
+            self.data_widget.setStyleSheet(self._cached_styles['data_widget'])
+        # Items that were never styled keep Qt's initial styling
+        if self._last_applied_style is not None:
+            self.update_appearance()
     
     def set_message_color(self, color):
         """Set the color of the message text"""
         if self.message_color != color:
             self.message_color = color
+            self._style_table = None
             if not self.is_selected:  # Only update if not selected
                 self.update_appearance()
\ No newline at end of file
@@ -1,5 +1,19 @@
 from PyQt6.QtCore import pyqtSignal
 from widgets.base_list_item import BaseListItem
+from functools import lru_cache
+
+
+# (threshold, divisor, suffix), largest unit first
+_SIZE_STEPS = ((1024 * 1024, 1024 * 1024, "MB"), (1024, 1024, "KB"))
+
+
+@lru_cache(maxsize=2048)
+def _format_size(size_bytes):
+    """Format size in bytes to human-readable string"""
+    for threshold, divisor, suffix in _SIZE_STEPS:
+        if size_bytes > threshold:
+            return f"{size_bytes / divisor:.1f} {suffix}"
+    return f"{size_bytes} B"
 
 
 class InstalledListItem(BaseListItem):
@@ -14,10 +28,22 @@ class InstalledListItem(BaseListItem):
     
     def setup_ui(self):
         """Setup installed package-specific UI"""
-        # Set package data
+        self._show_package()
+        
+        # Connect remove button
+        self.removeButton.clicked.connect(self._on_remove_clicked)
+    
+    def rebind(self, package_info):
+        """Show another package in this widget without rebuilding it"""
+        self.package_info = package_info
+        self._show_package()
+    
+    def _show_package(self):
+        """Set package data"""
         name = self.package_info.get('name', 'Unknown Package')
+        self._name = name
         self.nameLabel.setText(name)
-        self.descLabel.setText(self.package_info.get('description', 'No description available'))
+        self._set_description(self.package_info.get('description', 'No description available'))
         self.backendLabel.setText(self.package_info.get('backend', 'apt').upper())
         
         # Set version and size info
@@ -25,23 +51,12 @@ class InstalledListItem(BaseListItem):
         installed_size = self.package_info.get('installed_size', 0)
         size_str = self._format_size(installed_size)
         
-        self.infoLabel.setText(
-            f'<span style="color: palette(window-text);">{version}</span> '
-            f'<span style="color: palette(window-text);">•</span> '
-            f'<span style="color: palette(window-text);">{size_str}</span>'
-        )
-        
-        # Connect remove button
-        self.removeButton.clicked.connect(lambda: self.remove_requested.emit(name))
-        
-        # Apply dev outline
-        self._apply_dev_outline(self.iconLabel, self.nameLabel, self.descLabel,
-                                self.infoLabel, self.backendLabel, self.removeButton)
+        self.infoLabel.setText(f'{version} • {size_str}')
+    
+    def _on_remove_clicked(self, _checked=False):
+        """Request removal of this package"""
+        self.remove_requested.emit(self._name)
     
     def _format_size(self, size_bytes):
         """Format size in bytes to human-readable string"""
-        if size_bytes > 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
-        elif size_bytes > 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        return f"{size_bytes} B"
+        return _format_size(size_bytes)
@@ -1,14 +1,36 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QTextEdit, QPushButton, QFrame, QStatusBar)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QPropertyAnimation, QEasingCurve, QPoint
+                             QPlainTextEdit, QPushButton, QFrame, QStatusBar)
+from PyQt6.QtCore import Qt, QTimer, QEvent, pyqtSignal, QPropertyAnimation, QEasingCurve, QPoint
 from PyQt6.QtGui import QFont, QCursor
-import pyte
+from collections import deque
+
+
+_FONTS = None
+
+
+def _get_fonts():
+    """Get the shared console fonts, built once QApplication exists"""
+    global _FONTS
+    if _FONTS is None:
+        title_font = QFont()
+        title_font.setBold(True)
+        icon_font = QFont()
+        icon_font.setPointSize(14)
+        _FONTS = {
+            'title': title_font,
+            'icon': icon_font,
+            'mono': QFont("monospace", 9),
+        }
+    return _FONTS
+
 
 class OperationPanel(QWidget):
     """Resizable overlay panel for package operations with collapsible status bar"""
     
     collapsed = pyqtSignal()
     
+    MAX_LINES = 5000
+    
     def __init__(self, parent=None, app_settings=None):
         super().__init__(parent)
         self.setObjectName("operationPanel")
@@ -18,6 +40,8 @@ class OperationPanel(QWidget):
         self.max_height_ratio = 0.8
         self.drag_start_y = None
         self.drag_start_height = None
+        self._pending_y = None
+        self._pending_lines = deque(maxlen=self.MAX_LINES)  # Output received while collapsed
         self.app_settings = app_settings
         self.last_height = app_settings.get_operation_panel_height() if app_settings else self.default_height
         
@@ -31,6 +55,16 @@ class OperationPanel(QWidget):
         """)
         self.shade.hide()
         
+        # Keep the shade sized to the window; only a window resize changes it
+        if parent is not None:
+            parent.installEventFilter(self)
+        
+        # Coalesce drag events so the panel is resized at most once per frame
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self._flush_resize)
+        
         self.setup_ui()
         self.hide()
     
@@ -58,32 +92,29 @@ class OperationPanel(QWidget):
         
         # Header
         self.title_label = QLabel("Operations Console")
-        title_font = QFont()
-        title_font.setBold(True)
-        self.title_label.setFont(title_font)
+        self.title_label.setFont(_get_fonts()['title'])
         self.title_label.setWordWrap(True)
         content_layout.addWidget(self.title_label)
         
-        # Output text area with terminal emulation
-        self.output_text = QTextEdit()
+        # Output text area
+        self.output_text = QPlainTextEdit()
         self.output_text.setReadOnly(True)
-        self.output_text.setFont(QFont("monospace", 9))
+        self.output_text.setUndoRedoEnabled(False)
+        self.output_text.setMaximumBlockCount(self.MAX_LINES)
+        self.output_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.output_text.setFont(_get_fonts()['mono'])
         self.output_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1e1e1e;
                 color: #d4d4d4;
             }
         """)
         content_layout.addWidget(self.output_text)
         
-        # Terminal emulator (will be initialized with proper size)
-        self.screen = None
-        self.stream = None
-        self._init_terminal()
-        
         layout.addWidget(content)
         
-        # Style with shadow
+        # The border and the overlay shade separate the panel from the window;
+        # a graphics effect would re-render the whole panel on every update
         self.setStyleSheet("""
             #operationPanel {
                 background: palette(base);
@@ -101,16 +132,6 @@ class OperationPanel(QWidget):
                 background: palette(base);
             }
         """)
-        
-        # Add drop shadow effect
-        from PyQt6.QtWidgets import QGraphicsDropShadowEffect
-        from PyQt6.QtGui import QColor
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setXOffset(0)
-        shadow.setYOffset(-5)
-        shadow.setColor(QColor(0, 0, 0, 160))
-        self.setGraphicsEffect(shadow)
     
     def start_resize(self, event):
         """Start resizing the panel"""
@@ -121,20 +142,34 @@ class OperationPanel(QWidget):
     def do_resize(self, event):
         """Resize the panel as user drags"""
         if self.drag_start_y is not None:
-            delta = self.drag_start_y - event.globalPosition().y()
-            new_height = self.drag_start_height + delta
-            
-            max_height = int(self.parent().height() * self.max_height_ratio)
-            new_height = int(max(self.min_height, min(new_height, max_height)))
-            
-            self.setFixedHeight(new_height)
-            self.last_height = new_height
-            self.update_position()
+            self._pending_y = event.globalPosition().y()
+            if not self._resize_timer.isActive():
+                self._resize_timer.start()
+    
+    def _flush_resize(self):
+        """Apply the latest drag position"""
+        if self.drag_start_y is None or self._pending_y is None:
+            return
+        
+        delta = self.drag_start_y - self._pending_y
+        new_height = self.drag_start_height + delta
+        
+        max_height = int(self.parent().height() * self.max_height_ratio)
+        new_height = int(max(self.min_height, min(new_height, max_height)))
+        
+        self.setFixedHeight(new_height)
+        self.last_height = new_height
+        self.update_position()
     
     def end_resize(self, event):
         """End resizing"""
+        # Apply the final position before the drag state is cleared
+        if self._resize_timer.isActive():
+            self._resize_timer.stop()
+            self._flush_resize()
         self.drag_start_y = None
         self.drag_start_height = None
+        self._pending_y = None
         # Save height to settings after resize is complete
         if self.app_settings:
             self.app_settings.set_operation_panel_height(self.last_height)
@@ -146,14 +181,15 @@ class OperationPanel(QWidget):
         
         self.is_expanded = True
         
-        # Show and position shade
+        # Show shade over the parent; eventFilter keeps it sized while shown
         if self.parent():
-            self.shade.setGeometry(0, 0, self.parent().width(), self.parent().height())
-            self.shade.show()
+            self.shade.setGeometry(self.parent().rect())
+            self.shade.setVisible(True)
             self.shade.raise_()
         
         self.show()
         self.raise_()
+        self._flush_pending_output()
         
         # Use last height, constrained by current window size
         parent_height = self.parent().height()
@@ -169,17 +205,8 @@ class OperationPanel(QWidget):
         self.animation.setStartValue(QPoint(0, parent_height))
         self.animation.setEndValue(QPoint(0, parent_height - panel_height))
         self.animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        self.animation.finished.connect(self._on_expand_finished)
         self.animation.start()
     
-    def _on_expand_finished(self):
-        """Handle expansion animation finished"""
-        # Recalculate terminal width now that panel is fully visible
-        if self.screen:
-            new_cols = self._calculate_terminal_width()
-            if new_cols != self.screen.columns:
-                self.screen.resize(lines=self.screen.lines, columns=new_cols)
-    
     def collapse_panel(self):
         """Collapse the panel with animation"""
         if not self.is_expanded:
@@ -188,7 +215,7 @@ class OperationPanel(QWidget):
         self.is_expanded = False
         
         # Hide shade
-        self.shade.hide()
+        self.shade.setVisible(False)
         
         # Animate slide down
         parent_height = self.parent().height()
@@ -208,46 +235,12 @@ class OperationPanel(QWidget):
             parent_height = self.parent().height()
             self.move(0, parent_height - self.height())
             self.setFixedWidth(self.parent().width())
-            # Update shade size
-            self.shade.setGeometry(0, 0, self.parent().width(), parent_height)
-    
-    def _init_terminal(self):
-        """Initialize terminal with calculated dimensions"""
-        cols = self._calculate_terminal_width()
-        rows = 100  # Large enough for scrolling
-        self.screen = pyte.Screen(cols, rows)
-        self.stream = pyte.Stream(self.screen)
-    
-    def _calculate_terminal_width(self):
-        """Calculate terminal width based on widget width"""
-        if not self.output_text or not self.output_text.isVisible():
-            return 120
-        
-        # Get font metrics
-        font_metrics = self.output_text.fontMetrics()
-        char_width = font_metrics.horizontalAdvance('M')  # Use 'M' for monospace width
-        
-        if char_width <= 0:
-            return 120
-        
-        # Get available width (account for scrollbar ~20px and small margin)
-        available_width = self.output_text.viewport().width() - 25
-        
-        if available_width <= 0:
-            return 120
-        
-        # Calculate columns
-        cols = max(80, available_width // char_width)
-        return cols
     
-    def resizeEvent(self, event):
-        """Handle resize to update terminal width"""
-        super().resizeEvent(event)
-        if self.screen:
-            new_cols = self._calculate_terminal_width()
-            if new_cols != self.screen.columns:
-                # Resize terminal
-                self.screen.resize(lines=self.screen.lines, columns=new_cols)
+    def eventFilter(self, obj, event):
+        """Resize the shade along with the parent window"""
+        if event.type() == QEvent.Type.Resize and obj is self.parent():
+            self.shade.setGeometry(obj.rect())
+        return super().eventFilter(obj, event)
     
     def set_operation(self, operation_type: str, package_name: str, command: str):
         """Set the current operation details"""
@@ -256,23 +249,37 @@ class OperationPanel(QWidget):
         else:
             self.title_label.setText("Operations Console")
         self.output_text.clear()
-        # Reinitialize terminal with current width
-        self._init_terminal()
+        self._pending_lines.clear()
+    
+    def append_lines(self, lines):
+        """Append lines of command output
+        
+        While the panel is collapsed the lines are only collected; they are
+        added when it is shown again.
+        """
+        if not self.isVisible():
+            self._pending_lines.extend(lines)
+            return
+        # Follows the output unless the user has scrolled up to read
+        self.output_text.appendPlainText('\n'.join(lines))
     
-    def append_output(self, text: str):
-        """Update output area with terminal content"""
-        # Update display with full terminal content
-        self.output_text.setPlainText(text)
-        self.output_text.verticalScrollBar().setValue(
-            self.output_text.verticalScrollBar().maximum()
-        )
+    def append_line(self, text: str):
+        """Add a line below the output"""
+        self.append_lines([text])
+    
+    def _flush_pending_output(self):
+        """Add output that arrived while the panel was hidden"""
+        if self._pending_lines:
+            lines = list(self._pending_lines)
+            self._pending_lines.clear()
+            self.append_lines(lines)
     
     def set_complete(self, success: bool):
         """Mark operation as complete"""
         if success:
-            self.append_output("\n✓ Operation completed successfully")
+            self.append_line("✓ Operation completed successfully")
         else:
-            self.append_output("\n✗ Operation failed")
+            self.append_line("✗ Operation failed")
 
 
 class OperationStatusBar(QStatusBar):
@@ -281,6 +288,9 @@ class OperationStatusBar(QStatusBar):
     expand_requested = pyqtSignal()
     collapse_requested = pyqtSignal()
     
+    SPINNER_FRAMES = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")
+    SPINNER_INTERVAL = 150
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("operationStatusBar")
@@ -290,6 +300,11 @@ class OperationStatusBar(QStatusBar):
         self.spinner_timer.timeout.connect(self.update_spinner)
         self.is_expanded = False
         
+        # Restores "Ready" after a timed message; restarting it replaces the pending reset
+        self._msg_reset_timer = QTimer(self)
+        self._msg_reset_timer.setSingleShot(True)
+        self._msg_reset_timer.timeout.connect(self._reset_general_status)
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -300,9 +315,7 @@ class OperationStatusBar(QStatusBar):
         
         # Expand/collapse icon (always visible)
         self.expand_icon = QLabel("▲")
-        expand_font = QFont()
-        expand_font.setPointSize(14)
-        self.expand_icon.setFont(expand_font)
+        self.expand_icon.setFont(_get_fonts()['icon'])
         self.expand_icon.setFixedWidth(20)
         self.expand_icon.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.expand_icon.setToolTip("Expand operations console")
@@ -316,9 +329,7 @@ class OperationStatusBar(QStatusBar):
         
         # Spinner
         self.spinner_label = QLabel("⟳")
-        spinner_font = QFont()
-        spinner_font.setPointSize(14)
-        self.spinner_label.setFont(spinner_font)
+        self.spinner_label.setFont(_get_fonts()['icon'])
         op_layout.addWidget(self.spinner_label)
         
         # Status text
@@ -363,19 +374,28 @@ class OperationStatusBar(QStatusBar):
         if not self.operation_widget.isVisible():
             self.general_status_label.setText(message)
             if timeout > 0:
-                QTimer.singleShot(timeout, lambda: self.general_status_label.setText("Ready") if not self.operation_widget.isVisible() else None)
+                self._msg_reset_timer.start(timeout)
+            else:
+                self._msg_reset_timer.stop()
+    
+    def _reset_general_status(self):
+        """Restore the idle message unless an operation is showing"""
+        if not self.operation_widget.isVisible():
+            self.general_status_label.setText("Ready")
     
     def start_operation(self, operation_type: str, package_name: str):
         """Start showing operation in status bar"""
         self.status_label.setText(f"{operation_type} {package_name}...")
         self.operation_widget.show()
         self.general_status_label.clear()
-        self.spinner_timer.start(100)
+        self.spinner_timer.start(self.SPINNER_INTERVAL)
     
     def update_spinner(self):
         """Animate spinner"""
-        spinners = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-        self.spinner_label.setText(spinners[self.spinner_frame % len(spinners)])
+        # Nobody can see the spinner, skip the repaint
+        if not self.spinner_label.isVisible() or self.window().isMinimized():
+            return
+        self.spinner_label.setText(self.SPINNER_FRAMES[self.spinner_frame % len(self.SPINNER_FRAMES)])
         self.spinner_frame += 1
     
     def set_complete(self, success: bool, message: str):
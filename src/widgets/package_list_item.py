@@ -1,6 +1,30 @@
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import QTimer, pyqtSignal
+from PyQt6.QtGui import QPalette
+from PyQt6.QtWidgets import QApplication
+from PyQt6 import sip
 from widgets.base_list_item import BaseListItem
 from services.odrs_service import ODRSService
+from settings.app_settings import AppSettings
+import sys
+from functools import lru_cache, partial
+import weakref
+from collections import deque
+
+
+# Command line flags do not change while the app runs
+_DEV_LOGGING = '--dev-logging' in sys.argv
+
+# Rating display parts: (filled stars, empty stars, text, muted text)
+_NO_RATING = ('', '☆☆☆☆☆', ' No Ratings Available', True)
+
+
+@lru_cache(maxsize=512)
+def _rating_parts(rating_val, review_count):
+    """Format rating display parts; many packages share the same values"""
+    if review_count > 0:
+        filled = int(rating_val)
+        return ('★' * filled, '☆' * (5 - filled), f' {rating_val} ({review_count} reviews)', False)
+    return _NO_RATING
 
 
 class PackageListItem(BaseListItem):
@@ -8,89 +32,177 @@ class PackageListItem(BaseListItem):
     
     install_requested = pyqtSignal(str)
     
+    # Static rating states
+    DEV_MODE = ('', '', 'Dev Mode', True)
+    RATINGS_DISABLED = ('', '', 'Ratings Disabled', True)
+    COLLECTING = ('', '', 'Collecting rating...', False)
+    
+    # Setting shared by every item, read on first use
+    _odrs_enabled = None
+    
+    @classmethod
+    def _settings_cache(cls):
+        """Get (dev_logging, odrs_enabled), reading them once for all items"""
+        if cls._odrs_enabled is None:
+            cls._odrs_enabled = AppSettings().get_odrs_enabled()
+        return _DEV_LOGGING, cls._odrs_enabled
+    
+    # Items waiting for their first rating display, drained in batches
+    RATING_BATCH_SIZE = 50
+    _pending_ratings = deque()
+    _rating_timer = None
+    
+    @classmethod
+    def _queue_rating_display(cls, item):
+        """Queue an item for a batched rating display"""
+        cls._pending_ratings.append(weakref.ref(item))
+        if cls._rating_timer is None:
+            timer = QTimer(QApplication.instance())
+            timer.setInterval(0)
+            timer.timeout.connect(cls._drain_rating_queue)
+            cls._rating_timer = timer
+        if not cls._rating_timer.isActive():
+            cls._rating_timer.start()
+    
+    @classmethod
+    def _drain_rating_queue(cls):
+        """Update ratings for the next batch of queued items"""
+        pending = cls._pending_ratings
+        for _ in range(min(cls.RATING_BATCH_SIZE, len(pending))):
+            item = pending.popleft()()
+            if item is not None and not sip.isdeleted(item):
+                item.update_rating_display()
+        if not pending:
+            cls._rating_timer.stop()
+    
+    # Service used by items created without one
+    _default_odrs = None
+    
+    @classmethod
+    def _get_default_odrs(cls):
+        """Get the ODRS service shared by items created without one"""
+        if cls._default_odrs is None:
+            cls._default_odrs = ODRSService()
+        return cls._default_odrs
+    
+    @classmethod
+    def refresh_settings(cls):
+        """Re-read cached settings on next use"""
+        cls._odrs_enabled = None
+    
     def __init__(self, package, odrs_service=None, parent=None):
-        self.package = package
-        self.odrs_service = odrs_service or ODRSService()
+        self.odrs_service = odrs_service or self._get_default_odrs()
+        self._set_package(package)
         super().__init__('widgets/package_list_item.ui', parent)
         self.setup_ui()
     
+    def _set_package(self, package):
+        """Store the package and the values derived from it"""
+        self.package = package
+        self._name = getattr(package, 'name', '')
+        self.app_id = self.odrs_service.map_package_to_app_id(self._name)
+    
     def setup_ui(self):
         """Setup package-specific UI"""
-        # Set package data
-        self.nameLabel.setText(getattr(self.package, 'name', 'Unknown Package'))
-        self.descLabel.setText(getattr(self.package, 'description', 'No description available'))
-        self.backendLabel.setText(getattr(self.package, 'backend', 'apt').upper())
+        self._show_package()
         
         # Connect install button
-        self.installButton.clicked.connect(lambda: self.install_requested.emit(getattr(self.package, 'name', '')))
-        
-        # Apply dev outline
-        self._apply_dev_outline(self.iconLabel, self.nameLabel, self.descLabel, 
-                                self.ratingLabel, self.backendLabel, self.installButton)
+        self.installButton.clicked.connect(self._on_install_clicked)
+    
+    def rebind(self, package):
+        """Show another package in this widget without rebuilding it"""
+        self._set_package(package)
+        self._set_rating(self.COLLECTING)
+        self._show_package()
+    
+    def _show_package(self):
+        """Set package data"""
+        package = self.package
+        self.nameLabel.setText(self._name or 'Unknown Package')
+        self._set_description(getattr(package, 'description', 'No description available'))
+        self.backendLabel.setText(getattr(package, 'backend', 'apt').upper())
         
-        # Update rating display
+        # Rating display waits until the item is shown
+        self._rating_pending = False
         if not self.dev_outline:
-            from PyQt6.QtCore import QTimer
-            QTimer.singleShot(0, self.update_rating_display)
+            if self.isVisible():
+                self._queue_rating_display(self)
+            else:
+                self._rating_pending = True
+    
+    def showEvent(self, event):
+        """Queue a pending rating display once the item becomes visible"""
+        super().showEvent(event)
+        if self._rating_pending:
+            self._rating_pending = False
+            self._queue_rating_display(self)
+    
+    def _on_install_clicked(self, _checked=False):
+        """Request installation of this package"""
+        self.install_requested.emit(self._name)
     
     def update_rating_display(self):
         """Update rating display with fresh data"""
-        rating_text = self._get_rating_text()
-        self.ratingLabel.setText(rating_text)
+        # Items hidden since they were queued are refreshed when shown again
+        if not self.isVisible():
+            self._rating_pending = True
+            return
+        
+        self._set_rating(self._get_rating_parts())
+        
+        # Ratings not bundled with the package are read from the cache off the GUI thread
+        if self._needs_rating_lookup():
+            self.odrs_service.get_cached_rating_async(self.app_id, partial(self._on_rating_loaded, self.app_id))
+    
+    def _on_rating_loaded(self, app_id, rating):
+        """Show a rating delivered by the ODRS service"""
+        # The row may have been scrolled away or rebound while the lookup was running
+        if sip.isdeleted(self) or app_id != self.app_id:
+            return
+        self._set_rating(self._get_rating_parts(rating))
+    
+    def _set_rating(self, parts):
+        """Show rating parts in the plain text rating labels"""
+        stars, empty, text, muted = parts
+        self.ratingStarsLabel.setText(stars)
+        self.ratingEmptyLabel.setText(empty)
+        self.ratingLabel.setText(text)
+        self.ratingLabel.setForegroundRole(QPalette.ColorRole.Mid if muted else QPalette.ColorRole.WindowText)
+    
+    def _needs_rating_lookup(self) -> bool:
+        """Check whether the rating has to come from the ODRS cache"""
+        dev_logging, odrs_enabled = self._settings_cache()
+        if dev_logging or not odrs_enabled or not self.odrs_service:
+            return False
+        return getattr(self.package, 'rating', None) is None
     
-    def _get_rating_text(self) -> str:
-        """Get formatted rating text from ODRS"""
-        from settings.app_settings import AppSettings
-        import sys
+    def _get_rating_parts(self, rating=None) -> tuple:
+        """Get rating display parts, using a looked-up ODRS rating if given"""
+        dev_logging, odrs_enabled = self._settings_cache()
         
         # Skip rating lookups when dev logging is active
-        if '--dev-logging' in sys.argv:
-            return '<span style="color: palette(mid);">Dev Mode</span>'
+        if dev_logging:
+            return self.DEV_MODE
         
         # State 1: ODRS disabled
-        settings = AppSettings()
-        if not settings.get_odrs_enabled():
-            return '<span style="color: palette(mid);">Ratings Disabled</span>'
+        if not odrs_enabled:
+            return self.RATINGS_DISABLED
         
         # State 2: No ODRS service available
         if not self.odrs_service:
-            return '<span style="color: palette(window-text);">Collecting rating...</span>'
+            return self.COLLECTING
         
         try:
             # Check if rating is already included in package summary
-            if hasattr(self.package, 'rating') and self.package.rating is not None:
-                rating_val = self.package.rating
-                review_count = getattr(self.package, 'review_count', 0)
-                
-                if review_count > 0:
-                    filled_stars = int(rating_val)
-                    empty_stars = 5 - filled_stars
-                    stars_html = (
-                        f'<span style="color: #FFD700;">{"★" * filled_stars}</span>' +
-                        f'<span style="color: #B8860B;">{"☆" * empty_stars}</span>'
-                    )
-                    return f'{stars_html}<span style="color: palette(window-text);"> {rating_val} ({review_count} reviews)</span>'
-                else:
-                    empty_stars = '☆' * 5
-                    return f'<span style="color: #B8860B;">{empty_stars}</span><span style="color: palette(mid);"> No Ratings Available</span>'
-            
-            # Fallback to ODRS service lookup
-            package_name = getattr(self.package, 'name', '')
-            app_id = self.odrs_service.map_package_to_app_id(package_name)
-            rating = self.odrs_service._get_cached_rating(app_id)
+            package = self.package
+            rating_val = getattr(package, 'rating', None)
+            if rating_val is not None:
+                return _rating_parts(rating_val, getattr(package, 'review_count', 0))
             
+            # Fallback to the rating looked up from the ODRS cache
             if rating is None:
-                return '<span style="color: palette(window-text);">Collecting rating...</span>'
-            elif rating.review_count > 0:
-                filled_stars = int(rating.rating)
-                empty_stars = 5 - filled_stars
-                stars_html = (
-                    f'<span style="color: #FFD700;">{"★" * filled_stars}</span>' +
-                    f'<span style="color: #B8860B;">{"☆" * empty_stars}</span>'
-                )
-                return f'{stars_html}<span style="color: palette(window-text);"> {rating.rating} ({rating.review_count} reviews)</span>'
-            else:
-                empty_stars = '☆' * 5
-                return f'<span style="color: #B8860B;">{empty_stars}</span><span style="color: palette(mid);"> No Ratings Available</span>'
+                return self.COLLECTING
+            
+            return _rating_parts(rating.rating, rating.review_count)
         except Exception:
-            return '<span style="color: palette(window-text);">Collecting rating...</span>'
\ No newline at end of file
+            return self.COLLECTING
\ No newline at end of file
@@ -5,15 +5,35 @@ from PyQt6 import uic
 from utils.path_resolver import PathResolver
 import subprocess
 
+
+_DEPS_STYLE = """
+    QLabel#depSatisfied { font-size: 12px; color: green; }
+    QLabel#depMissing { font-size: 12px; color: red; }
+"""
+
+
 class PluginCard(QFrame):
     """Card widget for displaying plugin information"""
     
+    # Compiled form class, loaded on first construction
+    _form_class = None
+    
     def __init__(self, status, parent=None):
         super().__init__(parent)
-        uic.loadUi(PathResolver.get_ui_path('widgets/plugin_card.ui'), self)
+        self._setup_form()
         self.status = status
         self.populate()
     
+    def _setup_form(self):
+        """Build the widget tree from a form class compiled once"""
+        if PluginCard._form_class is None:
+            PluginCard._form_class, _ = uic.loadUiType(PathResolver.get_ui_path('widgets/plugin_card.ui'))
+        
+        form = PluginCard._form_class()
+        form.setupUi(self)
+        # Expose child widgets on self the same way uic.loadUi does
+        self.__dict__.update(vars(form))
+    
     def populate(self):
         """Populate card with plugin data"""
         status = self.status
@@ -30,45 +50,55 @@ class PluginCard(QFrame):
         self.populate_dependencies()
     
     def populate_dependencies(self):
-        """Populate dependencies section"""
+        """Populate dependencies section on first show"""
+        self._deps_populated = False
+        if self.isVisible():
+            self._populate_dependencies_lazy()
+    
+    def showEvent(self, event):
+        """Create dependency rows the first time the card is shown"""
+        if not self._deps_populated:
+            self._populate_dependencies_lazy()
+        super().showEvent(event)
+    
+    def _populate_dependencies_lazy(self):
+        """Create one label per dependency"""
+        self._deps_populated = True
         layout = self.depsContainerLayout
         
-        # System dependencies
-        for dep in self.status['dependencies']['system']:
-            dep_text = f"  • {dep['name']} ({dep['command']})"
-            if dep['satisfied']:
-                dep_text += " ✓"
-                if dep['installed_version']:
-                    dep_text += f" v{dep['installed_version']}"
-                color = "green"
-            else:
-                dep_text += " ✗ Missing"
-                if dep['required_version']:
-                    dep_text += f" (requires {dep['required_version']})"
-                color = "red"
-            
-            label = QLabel(dep_text)
-            label.setStyleSheet(f"font-size: 12px; color: {color};")
-            layout.addWidget(label)
+        # Colors come from one stylesheet on the container, keyed by object name
+        container = layout.parentWidget()
+        if container is not None:
+            container.setStyleSheet(container.styleSheet() + _DEPS_STYLE)
         
-        # Python dependencies
-        for dep in self.status['dependencies']['python']:
-            dep_text = f"  • Python: {dep['package']}"
-            if dep['satisfied']:
-                dep_text += " ✓"
-                if dep['installed_version']:
-                    dep_text += f" v{dep['installed_version']}"
-                color = "green"
-            else:
-                dep_text += " ✗ Missing"
-                if dep['required_version']:
-                    dep_text += f" (requires {dep['required_version']})"
-                color = "red"
-            
+        for dep_text, satisfied in self._dependency_rows():
             label = QLabel(dep_text)
-            label.setStyleSheet(f"font-size: 12px; color: {color};")
+            label.setObjectName("depSatisfied" if satisfied else "depMissing")
             layout.addWidget(label)
     
+    def _dependency_rows(self):
+        """Get (text, satisfied) for each system and Python dependency"""
+        dependencies = self.status['dependencies']
+        rows = [(self._dependency_text(f"{dep['name']} ({dep['command']})", dep), dep['satisfied'])
+                for dep in dependencies['system']]
+        rows.extend((self._dependency_text(f"Python: {dep['package']}", dep), dep['satisfied'])
+                    for dep in dependencies['python'])
+        return rows
+    
+    @staticmethod
+    def _dependency_text(title, dep):
+        """Format one dependency row"""
+        dep_text = f"  • {title}"
+        if dep['satisfied']:
+            dep_text += " ✓"
+            if dep['installed_version']:
+                dep_text += f" v{dep['installed_version']}"
+        else:
+            dep_text += " ✗ Missing"
+            if dep['required_version']:
+                dep_text += f" (requires {dep['required_version']})"
+        return dep_text
+    
     def setup_action_button(self):
         """Setup context-sensitive action button"""
         if self.status['missing_dependencies']:
@@ -136,30 +166,31 @@ class PluginCard(QFrame):
             if not dep['satisfied']:
                 packages.append(dep.get('package', dep['command']))
         
-        for dep in self.status['dependencies']['python']:
-            if not dep['satisfied']:
-                pkg = dep['package']
-                # Try python3- prefix first, fallback to python- if not found
-                python3_pkg = f"python3-{pkg}"
-                python_pkg = f"python-{pkg}"
-                
-                # Check which package exists
-                try:
-                    result = subprocess.run(['apt-cache', 'show', python3_pkg], 
-                                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                    if result.returncode == 0:
-                        packages.append(python3_pkg)
-                    else:
-                        # Try python- prefix
-                        result = subprocess.run(['apt-cache', 'show', python_pkg], 
-                                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                        if result.returncode == 0:
-                            packages.append(python_pkg)
-                        else:
-                            # Default to python3- if neither found
-                            packages.append(python3_pkg)
-                except:
-                    # Fallback to python3- on error
-                    packages.append(python3_pkg)
+        python_deps = [dep['package'] for dep in self.status['dependencies']['python']
+                       if not dep['satisfied']]
+        if not python_deps:
+            return packages
+        
+        # Check which python3-/python- packages exist with a single apt-cache call
+        candidates = []
+        for pkg in python_deps:
+            candidates.extend((f"python3-{pkg}", f"python-{pkg}"))
+        
+        try:
+            result = subprocess.run(['apt-cache', 'show', *candidates],
+                                    capture_output=True, text=True)
+            available = {line[9:].strip() for line in result.stdout.splitlines()
+                         if line.startswith('Package: ')}
+        except Exception:
+            available = set()
+        
+        for pkg in python_deps:
+            # Prefer python3-, fall back to python-, default to python3- if neither found
+            python3_pkg = f"python3-{pkg}"
+            python_pkg = f"python-{pkg}"
+            if python3_pkg not in available and python_pkg in available:
+                packages.append(python_pkg)
+            else:
+                packages.append(python3_pkg)
         
         return packages
@@ -20,35 +20,29 @@ class UpdateListItem(BaseListItem):
         
         # Set package data
         name = self.update_info.get('name', 'Unknown Package')
+        self._name = name
         self.nameLabel.setText(name)
-        self.descLabel.setText(self.update_info.get('description', 'No description available'))
+        self._set_description(self.update_info.get('description', 'No description available'))
         
-        # Set version info
-        current_version = self.update_info.get('current_version', '?')
-        new_version = self.update_info.get('new_version', '?')
-        self.versionLabel.setText(
-            f'<span style="color: palette(mid);">{current_version}</span> '
-            f'<span style="color: palette(window-text);">→</span> '
-            f'<span style="color: palette(highlight);">{new_version}</span>'
-        )
+        # Set version info; the arrow between them comes from the form
+        update_info = self.update_info
+        self.currentVersionLabel.setText(update_info.get('current_version', '?'))
+        self.newVersionLabel.setText(update_info.get('new_version', '?'))
         
         # Set backend label with security indicator
         backend = self.update_info.get('backend', 'apt').upper()
         if is_security:
             self.securityLabel.setText(f'🔒 {backend}')
+            # Set before the first show, so the initial polish picks them up
             self.securityLabel.setProperty("security", "true")
-            self.securityLabel.style().unpolish(self.securityLabel)
-            self.securityLabel.style().polish(self.securityLabel)
-            self.iconLabel.setText('🔒')
-            self.iconLabel.setStyleSheet(
-                "background-color: rgba(255, 107, 107, 0.2); border-radius: 8px;"
-            )
+            self.iconLabel.setProperty("security", "true")
+            self._set_icon('🔒')
         else:
             self.securityLabel.setText(backend)
         
         # Connect update button
-        self.updateButton.clicked.connect(lambda: self.update_requested.emit(name))
-        
-        # Apply dev outline
-        self._apply_dev_outline(self.iconLabel, self.nameLabel, self.descLabel,
-                                self.versionLabel, self.securityLabel, self.updateButton)
+        self.updateButton.clicked.connect(self._on_update_clicked)
+    
+    def _on_update_clicked(self, _checked=False):
+        """Request an update of this package"""
+        self.update_requested.emit(self._name)
@@ -1,4 +1,4 @@
-from PyQt6.QtWidgets import QScrollArea, QWidget, QVBoxLayout, QMainWindow, QLabel
+from PyQt6.QtWidgets import QScrollArea, QWidget, QVBoxLayout, QMainWindow, QLabel, QWIDGETSIZE_MAX
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from widgets.package_list_item import PackageListItem
 from widgets.installed_list_item import InstalledListItem
@@ -25,9 +25,26 @@ class VirtualCategoryContainer(QScrollArea):
         self.container_layout.setContentsMargins(10, 10, 10, 10)
         self.container_layout.setSpacing(2)
         
+        # Spacers stand in for the items above and below the visible range;
+        # visible items are kept between them
+        self.top_spacer = QWidget()
+        self.bottom_spacer = QWidget()
+        self.top_spacer.hide()
+        self.bottom_spacer.hide()
+        self.container_layout.addWidget(self.top_spacer)
+        self.container_layout.addWidget(self.bottom_spacer)
+        self.no_packages_label = None
+        self._packages_changed = False
+        self._last_range = None  # (first, last) shown by the last update
+        
+        # Hidden item widgets kept for reuse, by widget class
+        self._pools = {PackageListItem: [], InstalledListItem: []}
+        self._item_packages = {}  # widget -> package shown in it
+        
         self.setWidget(self.container)
         self.setWidgetResizable(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._viewport_height = self.viewport().height()  # Refreshed in resizeEvent
         
         # Connect scroll events
         self.verticalScrollBar().valueChanged.connect(self.update_visible_widgets)
@@ -36,10 +53,18 @@ class VirtualCategoryContainer(QScrollArea):
         self.update_timer = QTimer()
         self.update_timer.setSingleShot(True)
         self.update_timer.timeout.connect(self.perform_update)
+        
+        # Scroll updates run at once, then at most once per frame while scrolling
+        self._scroll_pending = False
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(16)
+        self._scroll_timer.timeout.connect(self._flush_scroll_update)
     
     def set_packages(self, packages):
         """Set packages and trigger virtual scrolling update"""
         self.all_packages = packages
+        self._packages_changed = True
         self.schedule_update()
     
     def schedule_update(self):
@@ -49,85 +74,141 @@ class VirtualCategoryContainer(QScrollArea):
     
     def perform_update(self):
         """Perform the actual virtual scrolling update"""
-        # Clear existing widgets
-        for widget in self.visible_widgets.values():
-            widget.setParent(None)
-        self.visible_widgets.clear()
-        
-        # Clear layout
-        while self.container_layout.count():
-            child = self.container_layout.takeAt(0)
-            if child.widget():
-                child.widget().setParent(None)
+        # Widgets for the previous package list no longer match their index
+        if self._packages_changed:
+            self._packages_changed = False
+            self._clear_widgets()
+            if self.all_packages:
+                self.container.setFixedHeight(len(self.all_packages) * self.item_height)
+            else:
+                # Let the message size the container
+                self.container.setMinimumHeight(0)
+                self.container.setMaximumHeight(QWIDGETSIZE_MAX)
         
         if not self.all_packages:
-            # Show "No packages available" message
-            no_packages_label = QLabel("No packages available in this category")
-            no_packages_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_packages_label.setStyleSheet("color: gray; font-size: 14px; padding: 40px;")
-            self.container_layout.addWidget(no_packages_label)
+            self._show_no_packages()
             return
-        
-        # Calculate total height needed
-        total_height = len(self.all_packages) * self.item_height
-        self.container.setFixedHeight(total_height)
+        if self.no_packages_label is not None:
+            self.no_packages_label.hide()
         
         # Calculate visible range
         viewport_top = self.verticalScrollBar().value()
-        viewport_height = self.viewport().height()
-        viewport_bottom = viewport_top + viewport_height
+        viewport_bottom = viewport_top + self._viewport_height
         
         # Calculate which items should be visible
         first_visible = max(0, (viewport_top // self.item_height) - self.viewport_buffer)
         last_visible = min(len(self.all_packages) - 1, 
                           ((viewport_bottom // self.item_height) + self.viewport_buffer))
         
-        # Add spacer for items above visible range
-        if first_visible > 0:
-            top_spacer = QWidget()
-            top_spacer.setFixedHeight(first_visible * self.item_height)
-            self.container_layout.addWidget(top_spacer)
-        
-        # Create widgets for visible items
-        for i in range(first_visible, last_visible + 1):
-            if i < len(self.all_packages):
-                package = self.all_packages[i]
-                
-                # Use InstalledListItem if package is installed
-                if getattr(package, 'is_installed', False):
-                    pkg_dict = {
-                        'name': package.name,
-                        'description': package.description,
-                        'version': package.version,
-                        'backend': getattr(package, 'backend', 'apt'),
-                        'installed_size': getattr(package, 'installed_size', 0)
-                    }
-                    widget = InstalledListItem(pkg_dict)
-                    widget.remove_requested.connect(self.on_install_requested)
-                else:
-                    widget = PackageListItem(package, self.odrs_service)
-                    widget.install_requested.connect(self.on_install_requested)
-                
-                widget.double_clicked.connect(lambda p=package: self.on_package_selected(p))
-                widget.setFixedHeight(self.item_height)
-                self.container_layout.addWidget(widget)
+        if (first_visible, last_visible) == self._last_range:
+            return  # Same range, nothing to do
+        self._last_range = (first_visible, last_visible)
+        current_range = range(first_visible, last_visible + 1)
+        
+        # Release widgets that left the visible range
+        for index in [index for index in self.visible_widgets if index not in current_range]:
+            self._release_widget(self.visible_widgets.pop(index))
+        
+        # Fill in rows that entered it; the top spacer is at layout index 0
+        for i in current_range:
+            if i not in self.visible_widgets:
+                widget = self._acquire_widget(self.all_packages[i])
+                self.container_layout.insertWidget(1 + i - first_visible, widget)
+                widget.show()
                 self.visible_widgets[i] = widget
         
-        # Add spacer for items below visible range
+        # Resize the spacers for items above and below the visible range
+        self._set_spacer_height(self.top_spacer, first_visible * self.item_height)
         remaining_items = len(self.all_packages) - (last_visible + 1)
-        if remaining_items > 0:
-            bottom_spacer = QWidget()
-            bottom_spacer.setFixedHeight(remaining_items * self.item_height)
-            self.container_layout.addWidget(bottom_spacer)
+        self._set_spacer_height(self.bottom_spacer, remaining_items * self.item_height)
+    
+    def _acquire_widget(self, package):
+        """Get the list item widget for a package, reusing a pooled one if possible"""
+        # Use InstalledListItem if package is installed
+        if getattr(package, 'is_installed', False):
+            widget_class = InstalledListItem
+            data = {
+                'name': package.name,
+                'description': package.description,
+                'version': package.version,
+                'backend': getattr(package, 'backend', 'apt'),
+                'installed_size': getattr(package, 'installed_size', 0)
+            }
+        else:
+            widget_class = PackageListItem
+            data = package
+        
+        pool = self._pools[widget_class]
+        if pool:
+            widget = pool.pop()
+            widget.rebind(data)
+        else:
+            if widget_class is InstalledListItem:
+                widget = InstalledListItem(data)
+                widget.remove_requested.connect(self.on_install_requested)
+            else:
+                widget = PackageListItem(data, self.odrs_service)
+                widget.install_requested.connect(self.on_install_requested)
+            widget.double_clicked.connect(self._on_item_double_clicked)
+            widget.setFixedHeight(self.item_height)
+        
+        self._item_packages[widget] = package
+        return widget
+    
+    def _release_widget(self, widget):
+        """Take a widget out of the layout and keep it hidden for reuse"""
+        self.container_layout.removeWidget(widget)
+        widget.hide()
+        del self._item_packages[widget]
+        self._pools[type(widget)].append(widget)
+    
+    def _clear_widgets(self):
+        """Release all visible item widgets"""
+        for widget in self.visible_widgets.values():
+            self._release_widget(widget)
+        self.visible_widgets.clear()
+        self._last_range = None
+    
+    def _set_spacer_height(self, spacer, height):
+        """Resize a spacer, hiding it when empty so it takes no layout spacing"""
+        if height > 0:
+            spacer.setFixedHeight(height)
+        spacer.setVisible(height > 0)
+    
+    def _show_no_packages(self):
+        """Show the "No packages available" message"""
+        self.top_spacer.hide()
+        self.bottom_spacer.hide()
+        if self.no_packages_label is None:
+            self.no_packages_label = QLabel("No packages available in this category")
+            self.no_packages_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.no_packages_label.setStyleSheet("color: gray; font-size: 14px; padding: 40px;")
+            self.container_layout.addWidget(self.no_packages_label)
+        self.no_packages_label.show()
     
     def update_visible_widgets(self):
         """Update visible widgets when scrolling"""
-        self.schedule_update()
+        if self._scroll_timer.isActive():
+            self._scroll_pending = True
+            return
+        self.perform_update()
+        self._scroll_timer.start()
+    
+    def _flush_scroll_update(self):
+        """Apply the scroll position reached during the last interval"""
+        if self._scroll_pending:
+            self._scroll_pending = False
+            self.perform_update()
+            self._scroll_timer.start()
     
     def on_install_requested(self, package_name):
         """Forward install request signal"""
         self.install_requested.emit(package_name)
     
+    def _on_item_double_clicked(self):
+        """Select the package shown in the double-clicked widget"""
+        self.on_package_selected(self._item_packages[self.sender()])
+    
     def on_package_selected(self, package):
         """Forward package selection signal"""
         pkg_dict = {
@@ -142,4 +223,5 @@ class VirtualCategoryContainer(QScrollArea):
     def resizeEvent(self, event):
         """Handle resize events"""
         super().resizeEvent(event)
+        self._viewport_height = self.viewport().height()
         self.schedule_update()
\ No newline at end of file
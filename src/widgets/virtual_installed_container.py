@@ -14,6 +14,7 @@ class VirtualInstalledContainer(QScrollArea):
         super().__init__()
         self.all_packages = []
         self.visible_widgets = {}
+        self._pool = []  # Hidden InstalledListItems kept for reuse
         
         # Virtual scrolling parameters
         self.item_height = 125
@@ -25,9 +26,21 @@ class VirtualInstalledContainer(QScrollArea):
         self.container_layout.setContentsMargins(0, 0, 0, 0)
         self.container_layout.setSpacing(0)
         
+        # Spacers stand in for the items above and below the visible range;
+        # visible items are kept between them
+        self.top_spacer = QWidget()
+        self.bottom_spacer = QWidget()
+        self.top_spacer.hide()
+        self.bottom_spacer.hide()
+        self.container_layout.addWidget(self.top_spacer)
+        self.container_layout.addWidget(self.bottom_spacer)
+        self._packages_changed = False
+        self._last_range = None  # (first, last, package count) at the last update
+        
         self.setWidget(self.container)
         self.setWidgetResizable(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._viewport_height = self.viewport().height()  # Refreshed in resizeEvent
         
         # Connect scroll events
         self.verticalScrollBar().valueChanged.connect(self.update_visible_widgets)
@@ -36,10 +49,18 @@ class VirtualInstalledContainer(QScrollArea):
         self.update_timer = QTimer()
         self.update_timer.setSingleShot(True)
         self.update_timer.timeout.connect(self.perform_update)
+        
+        # Scroll updates run at once, then at most once per frame while scrolling
+        self._scroll_pending = False
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(16)
+        self._scroll_timer.timeout.connect(self._flush_scroll_update)
     
     def set_packages(self, packages):
         """Set packages and trigger update"""
         self.all_packages = packages
+        self._packages_changed = True
         self.schedule_update()
     
     def add_packages(self, packages):
@@ -54,68 +75,100 @@ class VirtualInstalledContainer(QScrollArea):
     
     def perform_update(self):
         """Perform virtual scrolling update"""
+        # Widgets for the previous package list no longer match their index
+        if self._packages_changed:
+            self._packages_changed = False
+            self._clear_widgets()
+        
         if not self.all_packages:
+            self.top_spacer.hide()
+            self.bottom_spacer.hide()
             return
         
         # Calculate visible range
         viewport_top = self.verticalScrollBar().value()
-        viewport_height = self.viewport().height()
-        viewport_bottom = viewport_top + viewport_height
+        viewport_bottom = viewport_top + self._viewport_height
         
         first_visible = max(0, (viewport_top // self.item_height) - self.viewport_buffer)
         last_visible = min(len(self.all_packages) - 1,
                           ((viewport_bottom // self.item_height) + self.viewport_buffer))
         
-        # Check if range changed significantly
-        current_range = set(range(first_visible, last_visible + 1))
-        existing_range = set(self.visible_widgets.keys())
-        
-        if current_range == existing_range:
+        # Batches appended by add_packages only change the height below
+        visible_range = (first_visible, last_visible, len(self.all_packages))
+        if visible_range == self._last_range:
             return  # No change needed
+        self._last_range = visible_range
+        current_range = range(first_visible, last_visible + 1)
         
-        # Clear existing widgets
-        for widget in self.visible_widgets.values():
-            widget.setParent(None)
-        self.visible_widgets.clear()
-        
-        # Clear layout
-        while self.container_layout.count():
-            child = self.container_layout.takeAt(0)
-            if child.widget():
-                child.widget().setParent(None)
-        
-        # Calculate total height
-        total_height = len(self.all_packages) * self.item_height
-        self.container.setFixedHeight(total_height)
+        # Release widgets that left the visible range
+        for index in [index for index in self.visible_widgets if index not in current_range]:
+            self._release_widget(self.visible_widgets.pop(index))
         
-        # Top spacer
-        if first_visible > 0:
-            top_spacer = QWidget()
-            top_spacer.setFixedHeight(first_visible * self.item_height)
-            self.container_layout.addWidget(top_spacer)
-        
-        # Create visible widgets
-        for i in range(first_visible, last_visible + 1):
-            if i < len(self.all_packages):
-                pkg_info = self.all_packages[i]
-                widget = InstalledListItem(pkg_info)
-                widget.remove_requested.connect(self.remove_requested.emit)
-                widget.double_clicked.connect(lambda p=pkg_info: self.package_selected.emit(p))
-                self.container_layout.addWidget(widget)
+        # Fill in rows that entered it; the top spacer is at layout index 0
+        for i in current_range:
+            if i not in self.visible_widgets:
+                widget = self._acquire_widget(self.all_packages[i])
+                self.container_layout.insertWidget(1 + i - first_visible, widget)
+                widget.show()
                 self.visible_widgets[i] = widget
         
-        # Bottom spacer
+        # Size the container and the spacers around the visible range
+        self.container.setFixedHeight(len(self.all_packages) * self.item_height)
+        self._set_spacer_height(self.top_spacer, first_visible * self.item_height)
         remaining_items = len(self.all_packages) - (last_visible + 1)
-        if remaining_items > 0:
-            bottom_spacer = QWidget()
-            bottom_spacer.setFixedHeight(remaining_items * self.item_height)
-            self.container_layout.addWidget(bottom_spacer)
+        self._set_spacer_height(self.bottom_spacer, remaining_items * self.item_height)
+    
+    def _acquire_widget(self, pkg_info):
+        """Get an item widget for a package, reusing a pooled one if possible"""
+        if self._pool:
+            widget = self._pool.pop()
+            widget.rebind(pkg_info)
+        else:
+            widget = InstalledListItem(pkg_info)
+            widget.remove_requested.connect(self.remove_requested.emit)
+            widget.double_clicked.connect(self._on_item_double_clicked)
+        return widget
+    
+    def _release_widget(self, widget):
+        """Take a widget out of the layout and keep it hidden for reuse"""
+        self.container_layout.removeWidget(widget)
+        widget.hide()
+        self._pool.append(widget)
+    
+    def _clear_widgets(self):
+        """Release all visible item widgets"""
+        for widget in self.visible_widgets.values():
+            self._release_widget(widget)
+        self.visible_widgets.clear()
+        self._last_range = None
+    
+    def _set_spacer_height(self, spacer, height):
+        """Resize a spacer, hiding it when empty so it takes no layout space"""
+        if height > 0:
+            spacer.setFixedHeight(height)
+        spacer.setVisible(height > 0)
+    
+    def _on_item_double_clicked(self):
+        """Select the package shown in the double-clicked widget"""
+        self.package_selected.emit(self.sender().package_info)
     
     def update_visible_widgets(self):
-        """Update on scroll"""
-        self.schedule_update()
+        """Update visible widgets when scrolling"""
+        if self._scroll_timer.isActive():
+            self._scroll_pending = True
+            return
+        self.perform_update()
+        self._scroll_timer.start()
+    
+    def _flush_scroll_update(self):
+        """Apply the scroll position reached during the last interval"""
+        if self._scroll_pending:
+            self._scroll_pending = False
+            self.perform_update()
+            self._scroll_timer.start()
     
     def resizeEvent(self, event):
         """Handle resize"""
         super().resizeEvent(event)
+        self._viewport_height = self.viewport().height()
         self.schedule_update()
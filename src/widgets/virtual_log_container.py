@@ -1,7 +1,31 @@
-from PyQt6.QtWidgets import QScrollArea, QWidget, QVBoxLayout
+from PyQt6.QtWidgets import QScrollArea, QWidget, QVBoxLayout, QApplication
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QColor
+import re
 from widgets.expandable_item import ExpandableItem
+from utils.fenwick_tree import FenwickTree
+
+_LEVEL_SEARCH = re.compile(r'\b(CRITICAL|ERROR|WARNING|INFO|DEBUG)\b').search
+
+
+def entry_level(entry):
+    """Get the log level of a log entry, defaulting to INFO"""
+    # Entries from AppLogHandler carry the record's level
+    if isinstance(entry, dict):
+        level = entry.get('level')
+        if level:
+            return level
+        entry = entry['message']
+    match = _LEVEL_SEARCH(entry)
+    return match.group(1) if match else 'INFO'
+
+
+def entry_parts(entry):
+    """Get the (message, data) of a log entry in either the string or dict format"""
+    if isinstance(entry, dict):
+        return entry['message'], entry.get('data')
+    return entry, None
+
 
 class VirtualLogContainer(QScrollArea):
     """Virtual scrolling container for log entries"""
@@ -14,6 +38,11 @@ class VirtualLogContainer(QScrollArea):
         self.visible_widgets = {}  # index -> ExpandableItem
         self.expanded_items = set()  # Indices of expanded items
         self.selected_items = set()  # Indices of selected items
+        self._pool = []  # Hidden ExpandableItems kept for reuse
+        self._widget_indices = {}  # ExpandableItem -> index
+        self.row_heights = {}  # index -> height of expanded rows
+        self._heights = None  # FenwickTree of row heights, built on first update
+        self._entries_changed = False
         
         # Virtual scrolling parameters
         self.item_height = 30  # Estimated height per item
@@ -25,6 +54,16 @@ class VirtualLogContainer(QScrollArea):
         self.container_layout.setContentsMargins(0, 0, 0, 0)
         self.container_layout.setSpacing(1)
         
+        # Spacers stand in for the rows above and below the visible range;
+        # visible rows are kept between them, the stretch pushes them up
+        self.top_spacer = QWidget()
+        self.bottom_spacer = QWidget()
+        self.top_spacer.hide()
+        self.bottom_spacer.hide()
+        self.container_layout.addWidget(self.top_spacer)
+        self.container_layout.addWidget(self.bottom_spacer)
+        self.container_layout.addStretch()
+        
         self.setWidget(self.container)
         self.setWidgetResizable(True)
         
@@ -35,6 +74,13 @@ class VirtualLogContainer(QScrollArea):
         self.update_timer = QTimer()
         self.update_timer.setSingleShot(True)
         self.update_timer.timeout.connect(self.perform_update)
+        
+        # Scroll updates run at once, then at most once per frame while scrolling
+        self._scroll_pending = False
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(16)
+        self._scroll_timer.timeout.connect(self._flush_scroll_update)
     
     def set_log_entries(self, entries, colors):
         """Set log entries and trigger virtual scrolling update"""
@@ -42,9 +88,31 @@ class VirtualLogContainer(QScrollArea):
         self.colors = colors
         self.schedule_update()
     
-    def set_filtered_entries(self, entries):
-        """Set filtered entries and update display"""
+    def set_filtered_entries(self, entries, reset_state=False):
+        """Set filtered entries and update display
+        
+        Expanded rows, selection and measured heights follow their entries
+        to the new positions; entries no longer present lose their state.
+        reset_state drops it all, for when the filters change.
+        """
+        if reset_state:
+            self.expanded_items.clear()
+            self.selected_items.clear()
+            self.row_heights.clear()
+        else:
+            # Refreshes pass the same entry objects, so match them by identity
+            new_index = {id(entry): i for i, entry in enumerate(entries)}
+            moved = {}
+            for old, entry in enumerate(self.filtered_entries):
+                new = new_index.get(id(entry))
+                if new is not None:
+                    moved[old] = new
+            self.expanded_items = {moved[i] for i in self.expanded_items if i in moved}
+            self.selected_items = {moved[i] for i in self.selected_items if i in moved}
+            self.row_heights = {moved[i]: h for i, h in self.row_heights.items() if i in moved}
         self.filtered_entries = entries
+        self._entries_changed = True
+        self._heights = None
         self.schedule_update()
     
     def schedule_update(self):
@@ -54,60 +122,102 @@ class VirtualLogContainer(QScrollArea):
     
     def perform_update(self):
         """Perform the actual virtual scrolling update"""
-        # Clear existing widgets
-        for widget in list(self.visible_widgets.values()):
-            widget.setParent(None)
-        self.visible_widgets.clear()
+        # Widgets for the previous entries no longer match their index
+        if self._entries_changed:
+            self._entries_changed = False
+            for index in list(self.visible_widgets):
+                self._release_widget(index)
         
-        # Clear layout
-        while self.container_layout.count():
-            child = self.container_layout.takeAt(0)
-            if child.widget():
-                child.widget().setParent(None)
+        total = len(self.filtered_entries)
+        if total == 0:
+            self.top_spacer.hide()
+            self.bottom_spacer.hide()
+            return
         
         # Calculate visible range based on current scroll position
+        heights = self._get_heights()
         viewport_top = self.verticalScrollBar().value()
-        viewport_height = self.viewport().height()
+        viewport_bottom = viewport_top + self.viewport().height()
         
-        if len(self.filtered_entries) == 0:
-            return
+        first_visible = max(0, heights.find(viewport_top) - self.viewport_buffer)
+        last_visible = min(total - 1, heights.find(viewport_bottom) + self.viewport_buffer)
+        current_range = range(first_visible, last_visible + 1)
         
-        # Simple approach: show all filtered entries for now
-        # This can be optimized later for very large lists
-        for i, entry in enumerate(self.filtered_entries):
-            widget = self.create_widget_for_entry(entry, i)
-            self.container_layout.addWidget(widget)
-            self.visible_widgets[i] = widget
+        # Release widgets that left the visible range
+        for index in [index for index in self.visible_widgets if index not in current_range]:
+            self._release_widget(index)
         
-        # Add stretch to push items to top
-        self.container_layout.addStretch()
+        # Fill in rows that entered it; the top spacer is at layout index 0
+        for i in current_range:
+            if i not in self.visible_widgets:
+                widget = self.create_widget_for_entry(self.filtered_entries[i], i)
+                self.container_layout.insertWidget(1 + i - first_visible, widget)
+                widget.show()
+                self.visible_widgets[i] = widget
+        
+        # Resize the spacers for rows above and below the visible range
+        self._set_spacer_height(self.top_spacer, heights.prefix_sum(first_visible))
+        self._set_spacer_height(self.bottom_spacer, heights.total() - heights.prefix_sum(last_visible + 1))
+    
+    def _get_heights(self):
+        """Get the row height tree for the filtered entries"""
+        if self._heights is None:
+            total = len(self.filtered_entries)
+            self._heights = FenwickTree(total, self.item_height)
+            for index, height in self.row_heights.items():
+                if index < total:
+                    self._heights.add(index, height - self.item_height)
+        return self._heights
+    
+    def _release_widget(self, index):
+        """Take a row widget out of the layout and keep it hidden for reuse"""
+        widget = self.visible_widgets.pop(index)
+        self.container_layout.removeWidget(widget)
+        widget.hide()
+        del self._widget_indices[widget]
+        self._pool.append(widget)
+    
+    def _set_spacer_height(self, spacer, height):
+        """Resize a spacer, hiding it when empty so it takes no layout spacing"""
+        if height > 0:
+            spacer.setFixedHeight(height)
+        spacer.setVisible(height > 0)
+    
+    def _on_expanded_changed(self, widget, expanded):
+        """Track expanded rows and their height for spacer sizing"""
+        index = self._widget_indices.get(widget)
+        if index is None or expanded == (index in self.expanded_items):
+            return
+        old_height = self.row_heights.get(index, self.item_height)
+        if expanded:
+            self.expanded_items.add(index)
+            self.row_heights[index] = self.item_height + (widget._cached_data_height or 0)
+        else:
+            self.expanded_items.discard(index)
+            self.row_heights.pop(index, None)
+        if self._heights is not None:
+            self._heights.add(index, self.row_heights.get(index, self.item_height) - old_height)
+        self.schedule_update()
     
     def create_widget_for_entry(self, entry, index):
         """Create ExpandableItem widget for log entry"""
         # Handle both old string format and new dict format
-        if isinstance(entry, dict):
-            message = entry['message']
-            data = entry.get('data')
-        else:
-            message = entry
-            data = None
+        message, data = entry_parts(entry)
         
-        # Extract log level for color
-        level = 'INFO'
-        for lvl in ['CRITICAL', 'ERROR', 'WARNING', 'INFO', 'DEBUG']:
-            if lvl in message:
-                level = lvl
-                break
+        color = self.colors.get(entry_level(entry), self.colors['INFO'])
         
-        color = self.colors.get(level, self.colors['INFO'])
-        
-        # Create widget
-        widget = ExpandableItem(message, data, color, self.logging_service)
-        widget.selection_changed.connect(lambda w: self.on_item_selected(w, index))
+        # Reuse a pooled widget when one is available
+        if self._pool:
+            widget = self._pool.pop()
+            widget.rebind(message, data, color)
+        else:
+            widget = ExpandableItem(message, data, color, self.logging_service)
+            widget.selection_changed.connect(self._on_selection_changed)
+            widget.expanded_changed.connect(self._on_expanded_changed)
+        self._widget_indices[widget] = index
         
         # Restore state
         if index in self.expanded_items:
-            widget.is_expanded = True
             widget.toggle_expanded()
         
         if index in self.selected_items:
@@ -115,10 +225,12 @@ class VirtualLogContainer(QScrollArea):
         
         return widget
     
+    def _on_selection_changed(self, widget):
+        """Forward a widget's selection with the index of its entry"""
+        self.on_item_selected(widget, self._widget_indices[widget])
+    
     def on_item_selected(self, widget, index):
         """Handle item selection"""
-        from PyQt6.QtWidgets import QApplication
-        
         # Check if Ctrl was held (multi-select mode)
         modifiers = QApplication.keyboardModifiers()
         if modifiers & Qt.KeyboardModifier.ControlModifier:
@@ -143,19 +255,30 @@ class VirtualLogContainer(QScrollArea):
     
     def update_visible_widgets(self):
         """Update visible widgets when scrolling"""
-        # For now, we're showing all items, so no need to update on scroll
-        # This can be optimized later for true virtual scrolling
-        pass
+        if self._scroll_timer.isActive():
+            self._scroll_pending = True
+            return
+        self.perform_update()
+        self._scroll_timer.start()
+    
+    def _flush_scroll_update(self):
+        """Apply the scroll position reached during the last interval"""
+        if self._scroll_pending:
+            self._scroll_pending = False
+            self.perform_update()
+            self._scroll_timer.start()
     
     def resizeEvent(self, event):
         """Handle resize events"""
         super().resizeEvent(event)
         self.schedule_update()
     
-    def get_selected_widgets(self):
-        """Get currently selected widgets for context menu operations"""
-        selected_widgets = []
-        for index in self.selected_items:
-            if index in self.visible_widgets:
-                selected_widgets.append(self.visible_widgets[index])
-        return selected_widgets
\ No newline at end of file
+    def get_selected_entries(self):
+        """Get (index, message, data) of every selected entry in display order
+        
+        Built from the entries rather than the row widgets, which only exist
+        for rows near the viewport.
+        """
+        return [(index, *entry_parts(self.filtered_entries[index]))
+                for index in sorted(self.selected_items)
+                if index < len(self.filtered_entries)]
\ No newline at end of file
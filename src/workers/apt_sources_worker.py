@@ -0,0 +1,20 @@
+"""Worker thread for reading APT source files"""
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+class APTSourcesWorker(QThread):
+    """Worker thread for parsing APT sources off the GUI thread"""
+    
+    finished_signal = pyqtSignal(list)
+    error_signal = pyqtSignal(str)
+    
+    def __init__(self, parse_sources):
+        super().__init__()
+        self.parse_sources = parse_sources
+    
+    def run(self):
+        try:
+            sources = self.parse_sources()
+            self.finished_signal.emit(sources)
+        except Exception as e:
+            self.error_signal.emit(str(e))
@@ -1,5 +1,15 @@
 """Worker thread for cache updates"""
 from PyQt6.QtCore import QThread, pyqtSignal
+from itertools import islice
+from operator import itemgetter
+import queue
+import threading
+
+# Positional PackageData fields, in field order, from a get_all_packages_for_cache() dict
+_PACKAGE_FIELDS = itemgetter(
+    'package_id', 'name', 'version', 'description', 'summary', 'section',
+    'architecture', 'size', 'installed_size', 'maintainer', 'homepage'
+)
 
 
 class CacheUpdateWorker(QThread):
@@ -8,7 +18,10 @@ class CacheUpdateWorker(QThread):
     finished_signal = pyqtSignal()
     error_signal = pyqtSignal(str)
     progress_signal = pyqtSignal(str)
-    count_signal = pyqtSignal(int, int)
+    count_signal = pyqtSignal(int, int)  # processed, total (-1 while unknown)
+    
+    BATCH_SIZE = 100
+    PIPELINE_DEPTH = 4  # Batches read ahead of the LMDB writes
     
     def __init__(self, update_categories, update_packages, update_installed, logging_service, lmdb_manager):
         super().__init__()
@@ -21,9 +34,12 @@ class CacheUpdateWorker(QThread):
     def run(self):
         try:
             from controllers.apt_controller import APTController
+            from cache import PackageCacheModel, PackageData
             apt_controller = APTController(logging_service=self.logging_service)
+            pkg_cache = PackageCacheModel(self.lmdb_manager, 'apt')
             
-            if self.update_categories:
+            # A package update counts the categories from its own APT pass
+            if self.update_categories and not self.update_packages:
                 self.logging_service.info("Starting category update")
                 categories = apt_controller.get_section_details()
                 self.lmdb_manager.set_categories('apt', categories)
@@ -31,42 +47,64 @@ class CacheUpdateWorker(QThread):
             
             if self.update_packages:
                 self.logging_service.info("Starting package update")
-                self.progress_signal.emit("Loading package details")
-                packages = apt_controller.get_all_packages_for_cache()
+                self.progress_signal.emit("Caching package details")
+                
+                # APT is read in a producer thread while batches are written here
+                batches = queue.Queue(maxsize=self.PIPELINE_DEPTH)
+                stop = threading.Event()
+                producer = threading.Thread(
+                    target=self._read_batches, args=(apt_controller, batches, stop), daemon=True
+                )
+                producer.start()
                 
-                total = len(packages)
-                self.logging_service.info(f"Loaded {total} packages")
-                self.progress_signal.emit(f"Caching {total} packages")
+                processed = 0
+                section_indexes = {}  # section -> [package_ids]
+                installed_packages = []
+                try:
+                    for batch in iter(batches.get, None):
+                        # One write transaction per batch; indexes are written below
+                        batch_packages = [
+                            PackageData(
+                                *_PACKAGE_FIELDS(pkg_data),
+                                is_installed=pkg_data['is_installed'],
+                                metadata=pkg_data['metadata']
+                            )
+                            for pkg_data in batch
+                        ]
+                        pkg_cache.add_packages_bulk(batch_packages)
+                        
+                        # Collect the indexes as the packages go by
+                        for package in batch_packages:
+                            if package.section:
+                                section_indexes.setdefault(package.section, []).append(package.package_id)
+                            if package.is_installed:
+                                installed_packages.append(package.package_id)
+                        
+                        processed += len(batch)
+                        self.count_signal.emit(processed, -1)
+                finally:
+                    # Unblock the producer if the writes stopped early
+                    stop.set()
+                    while not batches.empty():
+                        batches.get_nowait()
+                    producer.join()
                 
-                batch_size = 100
-                from cache import PackageCacheModel, PackageData
+                self.logging_service.info(f"Cached {processed} packages")
+                self.count_signal.emit(processed, processed)
                 
-                for batch_start in range(0, total, batch_size):
-                    batch_end = min(batch_start + batch_size, total)
-                    batch = packages[batch_start:batch_end]
-                    
-                    pkg_cache = PackageCacheModel(self.lmdb_manager, 'apt')
-                    
-                    for pkg_data in batch:
-                        package = PackageData(
-                            package_id=pkg_data['package_id'],
-                            name=pkg_data['name'],
-                            version=pkg_data.get('version'),
-                            description=pkg_data.get('description', ''),
-                            summary=pkg_data.get('summary'),
-                            section=pkg_data.get('section'),
-                            architecture=pkg_data.get('architecture'),
-                            size=pkg_data.get('size'),
-                            installed_size=pkg_data.get('installed_size'),
-                            maintainer=pkg_data.get('maintainer'),
-                            homepage=pkg_data.get('homepage'),
-                            metadata=pkg_data.get('metadata', {})
-                        )
-                        pkg_cache.add_package(package)
-                    
-                    self.count_signal.emit(batch_end, total)
+                # Installed status was stored with each package, so the
+                # indexes are written directly instead of rebuilt from LMDB
+                self.progress_signal.emit("Writing indexes")
+                pkg_cache.write_indexes(section_indexes, installed_packages)
+                self.logging_service.info("Indexes written")
+                
+                if self.update_categories:
+                    section_counts = {section: len(ids) for section, ids in section_indexes.items()}
+                    categories = APTController.build_section_details(section_counts)
+                    self.lmdb_manager.set_categories('apt', categories)
+                    self.logging_service.info("Category cache updated")
             
-            if self.update_installed or self.update_packages:
+            elif self.update_installed:
                 self.logging_service.info("Updating installed package status")
                 self.progress_signal.emit("Updating installed status")
                 apt_controller.update_installed_status(self.lmdb_manager.lmdb_manager)
@@ -75,8 +113,6 @@ class CacheUpdateWorker(QThread):
                 # Rebuild indexes to update installed index
                 self.logging_service.info("Rebuilding indexes")
                 self.progress_signal.emit("Rebuilding indexes")
-                from cache import PackageCacheModel
-                pkg_cache = PackageCacheModel(self.lmdb_manager, 'apt')
                 pkg_cache.rebuild_indexes()
                 self.logging_service.info("Indexes rebuilt")
             
@@ -87,3 +123,15 @@ class CacheUpdateWorker(QThread):
             import traceback
             self.logging_service.error(traceback.format_exc())
             self.error_signal.emit(str(e))
+    
+    def _read_batches(self, apt_controller, batches, stop):
+        """Producer stage: queue package dicts from APT in BATCH_SIZE lists"""
+        try:
+            packages = apt_controller.iter_packages_for_cache()
+            while not stop.is_set():
+                batch = list(islice(packages, self.BATCH_SIZE))
+                if not batch:
+                    break
+                batches.put(batch)
+        finally:
+            batches.put(None)
@@ -1,5 +1,5 @@
 """Worker thread for loading installed packages"""
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QThread, QSemaphore, pyqtSignal
 
 
 class InstalledPackagesWorker(QThread):
@@ -9,50 +9,43 @@ class InstalledPackagesWorker(QThread):
     remaining_batch_signal = pyqtSignal(list)
     error_signal = pyqtSignal(str)
     
+    INITIAL_BATCH_SIZE = 20
+    BATCH_SIZE = 50
+    
     def __init__(self, apt_controller, lmdb_manager):
         super().__init__()
         self.apt_controller = apt_controller
         self.lmdb_manager = lmdb_manager
+        # Back-pressure: one remaining batch in flight until the GUI acks it
+        self._ack = QSemaphore(0)
+        self._stopped = False
+    
+    def ack_batch(self):
+        """Called by the receiver once a remaining batch has been consumed"""
+        self._ack.release()
+    
+    def stop(self):
+        """Stop loading and wake the thread if it is waiting for an ack"""
+        self._stopped = True
+        self._ack.release()
     
     def run(self):
-        import time
-        start = time.time()
-        print("[Worker] InstalledPackagesWorker.run() started")
         try:
-            # Load first 20 packages
-            print("[Worker] Loading initial batch (20 packages)")
-            batch_start = time.time()
             initial_packages = self.apt_controller.get_installed_packages_list(
-                self.lmdb_manager, limit=20, offset=0
+                self.lmdb_manager, limit=self.INITIAL_BATCH_SIZE, offset=0
             )
-            print(f"[Worker] Initial batch loaded in {time.time() - batch_start:.3f}s")
-            print(f"[Worker] Emitting initial_batch_signal with {len(initial_packages)} packages")
-            emit_start = time.time()
             self.initial_batch_signal.emit(initial_packages)
-            print(f"[Worker] Signal emitted in {time.time() - emit_start:.3f}s")
             
-            # Load remaining packages in batches
-            offset = 20
-            batch_size = 50
-            batch_num = 1
-            while True:
-                print(f"[Worker] Loading batch {batch_num} (offset={offset}, size={batch_size})")
-                batch_start = time.time()
+            # Load remaining packages one batch at a time
+            offset = self.INITIAL_BATCH_SIZE
+            while not self._stopped:
                 batch = self.apt_controller.get_installed_packages_list(
-                    self.lmdb_manager, limit=batch_size, offset=offset
+                    self.lmdb_manager, limit=self.BATCH_SIZE, offset=offset
                 )
-                print(f"[Worker] Batch {batch_num} loaded in {time.time() - batch_start:.3f}s ({len(batch)} packages)")
                 if not batch:
-                    print("[Worker] No more packages, stopping")
                     break
-                print(f"[Worker] Emitting remaining_batch_signal")
                 self.remaining_batch_signal.emit(batch)
-                offset += batch_size
-                batch_num += 1
-            
-            print(f"[Worker] InstalledPackagesWorker.run() completed in {time.time() - start:.3f}s")
+                offset += self.BATCH_SIZE
+                self._ack.acquire()
         except Exception as e:
-            print(f"[Worker] ERROR: {e}")
-            import traceback
-            traceback.print_exc()
             self.error_signal.emit(str(e))
@@ -1,10 +1,21 @@
 """Worker thread for package install/remove operations"""
 from PyQt6.QtCore import QThread, pyqtSignal
+import codecs
 import subprocess
 import os
-import pty
-import select
-import pyte
+import shlex
+import selectors
+import time
+from collections import deque
+
+
+# Base argv per operation; all but update_all take the package name
+_OPERATION_COMMANDS = {
+    'install': ('pkexec', 'apt-get', 'install', '-y'),
+    'remove': ('pkexec', 'apt-get', 'remove', '-y'),
+    'update': ('pkexec', 'apt-get', 'install', '--only-upgrade', '-y'),
+    'update_all': ('pkexec', 'apt-get', 'upgrade', '-y'),
+}
 
 
 class PackageOperationWorker(QThread):
@@ -12,109 +23,115 @@ class PackageOperationWorker(QThread):
     
     finished = pyqtSignal(bool, str)
     error = pyqtSignal(str)
-    output_line = pyqtSignal(str)
+    output_lines = pyqtSignal(list)  # New lines of command output
     command_started = pyqtSignal(str)
     
-    def __init__(self, backend, operation, package_name, logging_service=None, terminal_width=120):
+    READ_SIZE = 65536
+    POLL_TIMEOUT = 0.25  # How often to check for the command exiting while output is quiet
+    EMIT_INTERVAL = 0.05  # Coalesce reads into at most one signal per interval
+    LOG_TAIL_LINES = 4096
+    
+    def __init__(self, backend, operation, package_name, logging_service=None):
         super().__init__()
         self.backend = backend
         self.operation = operation
         self.package_name = package_name
         self.logging_service = logging_service
         self.logger = logging_service.get_logger('operations') if logging_service else None
-        self.output_buffer = []
+        self._last_emit = 0.0
+    
+    def _run_piped(self, cmd):
+        """Run cmd over a pipe, returning the exit code and the tail of its output
         
-        # Pyte terminal emulation with dynamic width
-        self.screen = pyte.Screen(terminal_width, 100)
-        self.stream = pyte.Stream(self.screen)
-        self.last_display = ""
+        The commands all pass -y and nothing is written to them, so no terminal
+        is needed; output is emitted line by line for the panel to append.
+        """
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            close_fds=True
+        )
+        
+        # Only the tail of a long run is kept for the log
+        tail = deque(maxlen=self.LOG_TAIL_LINES)
+        decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        partial = ''
+        pending = []  # Lines read but not yet emitted
+        eof = False
+        fd = process.stdout.fileno()
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            while not eof:
+                exited = process.poll() is not None
+                if exited:
+                    # Only drain what is already buffered
+                    timeout = 0
+                elif pending:
+                    timeout = self.EMIT_INTERVAL
+                else:
+                    timeout = self.POLL_TIMEOUT
+                
+                if selector.select(timeout=timeout):
+                    chunk = os.read(fd, self.READ_SIZE)
+                elif exited:
+                    # A daemon started by the command may keep the pipe open
+                    chunk = b''
+                else:
+                    chunk = None
+                
+                if chunk is not None:
+                    # Decode whatever one read returned, not line by line
+                    eof = not chunk
+                    lines = (partial + decoder.decode(chunk, final=eof)).split('\n')
+                    partial = lines.pop()
+                    if eof and partial:
+                        lines.append(partial)
+                    
+                    for line in lines:
+                        text = line.rstrip()
+                        tail.append(text)
+                        pending.append(text)
+                    if not eof and time.monotonic() - self._last_emit < self.EMIT_INTERVAL:
+                        continue
+                
+                if pending:
+                    self.output_lines.emit(pending)
+                    pending = []
+                self._last_emit = time.monotonic()
+        
+        process.stdout.close()
+        process.wait()
+        return process.returncode, '\n'.join(tail).rstrip()
     
     def run(self):
         try:
             # Build command
-            if self.operation == 'install':
-                cmd = ['pkexec', 'apt-get', 'install', '-y', self.package_name]
-            elif self.operation == 'remove':
-                cmd = ['pkexec', 'apt-get', 'remove', '-y', self.package_name]
-            elif self.operation == 'update':
-                cmd = ['pkexec', 'apt-get', 'install', '--only-upgrade', '-y', self.package_name]
-            elif self.operation == 'update_all':
-                cmd = ['pkexec', 'apt-get', 'upgrade', '-y']
-            else:
+            base = _OPERATION_COMMANDS.get(self.operation)
+            if base is None:
                 self.error.emit(f"Unknown operation: {self.operation}")
                 return
+            cmd = list(base)
+            if self.operation != 'update_all':
+                cmd.append(self.package_name)
             
-            cmd_str = ' '.join(cmd)
+            cmd_str = shlex.join(cmd)
             self.command_started.emit(cmd_str)
             
             # Log command
             if self.logger:
                 self.logger.info(f"Executing: {cmd_str}")
             
-            # Run command with PTY for interactive support
-            master_fd, slave_fd = pty.openpty()
-            
-            process = subprocess.Popen(
-                cmd,
-                stdin=slave_fd,
-                stdout=slave_fd,
-                stderr=slave_fd,
-                close_fds=True
-            )
-            
-            os.close(slave_fd)
-            
-            # Read output from PTY with Pyte terminal emulation
-            while True:
-                try:
-                    ready, _, _ = select.select([master_fd], [], [], 0.1)
-                    if ready:
-                        data = os.read(master_fd, 1024).decode('utf-8', errors='replace')
-                        if data:
-                            # Feed data to Pyte terminal emulator
-                            self.stream.feed(data)
-                            
-                            # Get current display and emit full screen
-                            current_display = '\n'.join(line.rstrip() for line in self.screen.display).rstrip()
-                            if current_display != self.last_display:
-                                self.output_line.emit(current_display)
-                                self.last_display = current_display
-                    
-                    # Check if process finished
-                    if process.poll() is not None:
-                        # Read any remaining data
-                        try:
-                            while True:
-                                data = os.read(master_fd, 1024).decode('utf-8', errors='replace')
-                                if not data:
-                                    break
-                                self.stream.feed(data)
-                        except:
-                            pass
-                        break
-                except OSError as e:
-                    # Errno 5 (I/O error) is expected when PTY closes
-                    if e.errno != 5 and self.logger:
-                        self.logger.error(f"PTY read error: {e}")
-                    break
-                except Exception as e:
-                    if self.logger:
-                        self.logger.error(f"PTY read error: {e}")
-                    break
-            
-            os.close(master_fd)
-            process.wait()
-            result = process.returncode == 0
-            
-            # Get final clean output from terminal
-            final_output = '\n'.join(line.rstrip() for line in self.screen.display).rstrip()
+            returncode, final_output = self._run_piped(cmd)
+            result = returncode == 0
             
             # Log result with output
             if self.logger:
                 if result:
                     self.logger.info(f"Command completed successfully", data=final_output)
                 else:
-                    self.logger.error(f"Command failed with exit code {process.returncode}", data=final_output)
+                    self.logger.error(f"Command failed with exit code {returncode}", data=final_output)
             
             self.finished.emit(result, self.package_name)
         except Exception as e:
@@ -1,20 +1,23 @@
-"""Worker thread for checking package updates"""
-from PyQt6.QtCore import QThread, pyqtSignal
+"""Pooled task for checking package updates"""
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 
 
-class UpdateCheckWorker(QThread):
-    """Worker thread for checking available updates"""
-    
+class UpdateCheckSignals(QObject):
+    """Signals for UpdateCheckWorker"""
     finished_signal = pyqtSignal(list)
     error_signal = pyqtSignal(str)
+
+class UpdateCheckWorker(QRunnable):
+    """One-shot update check run on the global thread pool"""
     
     def __init__(self, apt_controller):
         super().__init__()
         self.apt_controller = apt_controller
+        self.signals = UpdateCheckSignals()
     
     def run(self):
         try:
             updates = self.apt_controller.get_upgradable_packages()
-            self.finished_signal.emit(updates)
+            self.signals.finished_signal.emit(updates)
         except Exception as e:
-            self.error_signal.emit(str(e))
+            self.signals.error_signal.emit(str(e))
@@ -25,26 +25,29 @@ def test_plugin_dependencies():
     print(f"\nDiscovered {len(plugin_status)} plugin(s):\n")
     
     for backend_id, status in plugin_status.items():
-        print(f"Plugin: {status['display_name']} ({backend_id})")
-        print(f"  Status: {'✓ Available' if status['available'] else '✗ Unavailable'}")
-        print(f"  Capabilities: {', '.join(sorted(status['capabilities']))}")
+        # Collect each plugin's report and write it in one go
+        lines = []
+        lines.append(f"Plugin: {status['display_name']} ({backend_id})")
+        lines.append(f"  Status: {'✓ Available' if status['available'] else '✗ Unavailable'}")
+        lines.append(f"  Capabilities: {', '.join(sorted(status['capabilities']))}")
         
-        print(f"  System Dependencies:")
+        lines.append(f"  System Dependencies:")
         for dep in status['dependencies']['system']:
             status_icon = '✓' if dep['satisfied'] else '✗'
             version_info = f" v{dep['installed_version']}" if dep['installed_version'] else ""
-            print(f"    {status_icon} {dep['name']} ({dep['command']}){version_info}")
+            lines.append(f"    {status_icon} {dep['name']} ({dep['command']}){version_info}")
         
-        print(f"  Python Dependencies:")
+        lines.append(f"  Python Dependencies:")
         for dep in status['dependencies']['python']:
             status_icon = '✓' if dep['satisfied'] else '✗'
             version_info = f" v{dep['installed_version']}" if dep['installed_version'] else ""
-            print(f"    {status_icon} {dep['package']}{version_info}")
+            lines.append(f"    {status_icon} {dep['package']}{version_info}")
         
         if status['missing_dependencies']:
-            print(f"  Missing: {', '.join(status['missing_dependencies'])}")
+            lines.append(f"  Missing: {', '.join(status['missing_dependencies'])}")
         
-        print()
+        lines.append("")
+        sys.stdout.write(''.join(line + '\n' for line in lines))
     
     # Test refresh
     print("Testing plugin refresh...")
@@ -2,8 +2,8 @@
 """Test splash screen display"""
 
 import sys
-import time
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QTimer
 
 # Add src to path
 sys.path.insert(0, 'src')
@@ -31,12 +31,20 @@ def main():
         (100, "Ready", "Loaded 5,000 packages"),
     ]
     
-    for progress, status, detail in stages:
+    remaining = list(stages)
+    
+    def next_stage():
+        if not remaining:
+            print("✓ Splash screen test complete!")
+            splash.close()
+            app.quit()
+            return
+        progress, status, detail = remaining.pop(0)
         splash.update_progress(progress, status, detail)
-        time.sleep(0.5)  # Simulate work
+        QTimer.singleShot(500, next_stage)  # Simulate work
     
-    print("✓ Splash screen test complete!")
-    splash.close()
+    QTimer.singleShot(0, next_stage)
+    app.exec()
 
 if __name__ == '__main__':
     main()
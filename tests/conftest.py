@@ -0,0 +1,8 @@
+"""Shared pytest setup: import application modules from src/"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+# Manual harnesses that need a live APT/LMDB environment, not pytest tests
+collect_ignore = ['scripts']
@@ -25,11 +25,13 @@ def test_plugin_discovery():
     backends = pm.get_available_backends()
     print(f"\n✓ Discovered {len(backends)} backend(s): {backends}")
     
+    lines = []
     for backend_id in backends:
         backend = pm.get_backend(backend_id)
-        print(f"\n  Backend: {backend.display_name} ({backend_id})")
-        print(f"  Available: {backend.is_available()}")
-        print(f"  Capabilities: {backend.get_capabilities()}")
+        lines.append(f"\n  Backend: {backend.display_name} ({backend_id})")
+        lines.append(f"  Available: {backend.is_available()}")
+        lines.append(f"  Capabilities: {backend.get_capabilities()}")
+    sys.stdout.write(''.join(line + '\n' for line in lines))
     
     return pm
 
@@ -80,17 +82,19 @@ def test_plugin_capabilities():
     lmdb = LMDBManager()
     pm = PackageManager(lmdb)
     
+    lines = []
     for backend_id in pm.get_available_backends():
         backend = pm.get_backend(backend_id)
         caps = backend.get_capabilities()
         
-        print(f"\n{backend.display_name}:")
-        print(f"  Can search: {'search' in caps}")
-        print(f"  Can install: {'install' in caps}")
-        print(f"  Can remove: {'remove' in caps}")
-        print(f"  Can list installed: {'list_installed' in caps}")
-        print(f"  Can list updates: {'list_updates' in caps}")
-        print(f"  Has categories: {'categories' in caps}")
+        lines.append(f"\n{backend.display_name}:")
+        lines.append(f"  Can search: {'search' in caps}")
+        lines.append(f"  Can install: {'install' in caps}")
+        lines.append(f"  Can remove: {'remove' in caps}")
+        lines.append(f"  Can list installed: {'list_installed' in caps}")
+        lines.append(f"  Can list updates: {'list_updates' in caps}")
+        lines.append(f"  Has categories: {'categories' in caps}")
+    sys.stdout.write(''.join(line + '\n' for line in lines))
 
 def main():
     """Run all tests"""
@@ -0,0 +1,23 @@
+"""Tests for APTController helpers that don't need a live APT cache"""
+from controllers.apt_controller import APTController
+
+
+def test_build_section_details_flat_sections():
+    assert APTController.build_section_details({'editors': 3, 'net': 2}) == {'editors': 3, 'net': 2}
+
+
+def test_build_section_details_groups_hierarchical_sections():
+    counts = {'contrib/games': 2, 'contrib/net': 1, 'non-free/games': 4, 'utils': 5}
+    assert APTController.build_section_details(counts) == {
+        'contrib': {'games': 2, 'net': 1},
+        'non-free': {'games': 4},
+        'utils': 5,
+    }
+
+
+def test_build_section_details_splits_on_first_slash_only():
+    assert APTController.build_section_details({'a/b/c': 1, 'a/b': 2}) == {'a': {'b/c': 1, 'b': 2}}
+
+
+def test_build_section_details_empty():
+    assert APTController.build_section_details({}) == {}
@@ -0,0 +1,35 @@
+"""Tests for DEB822 stanza splitting"""
+import io
+
+from utils.deb822 import iter_stanzas
+
+
+def stanzas(text):
+    return list(iter_stanzas(io.StringIO(text)))
+
+
+def test_stanzas_split_on_blank_lines():
+    text = "Types: deb\nURIs: http://a\n\nTypes: deb-src\nURIs: http://b\n"
+    assert stanzas(text) == [
+        ["Types: deb\n", "URIs: http://a\n"],
+        ["Types: deb-src\n", "URIs: http://b\n"],
+    ]
+
+
+def test_whitespace_only_lines_separate_stanzas():
+    text = "Types: deb\n   \nTypes: deb-src\n\t\n"
+    assert stanzas(text) == [["Types: deb\n"], ["Types: deb-src\n"]]
+
+
+def test_repeated_and_leading_blank_lines_yield_no_empty_stanzas():
+    text = "\n\n  \nTypes: deb\n\n\n\nURIs: http://a\n\n"
+    assert stanzas(text) == [["Types: deb\n"], ["URIs: http://a\n"]]
+
+
+def test_last_stanza_without_trailing_newline():
+    assert stanzas("Types: deb\nSuites: stable") == [["Types: deb\n", "Suites: stable"]]
+
+
+def test_empty_input():
+    assert stanzas("") == []
+    assert stanzas("\n \n") == []
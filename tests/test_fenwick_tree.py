@@ -0,0 +1,63 @@
+"""Tests for the row height Fenwick tree"""
+import random
+
+from utils.fenwick_tree import FenwickTree
+
+
+def test_uniform_prefix_sums():
+    tree = FenwickTree(10, 30)
+    assert tree.total() == 300
+    for count in range(11):
+        assert tree.prefix_sum(count) == count * 30
+
+
+def test_add_updates_prefix_sums_and_total():
+    tree = FenwickTree(5, 10)
+    tree.add(2, 25)
+    assert tree.prefix_sum(2) == 20
+    assert tree.prefix_sum(3) == 55
+    assert tree.total() == 75
+    tree.add(2, -25)
+    assert tree.prefix_sum(5) == tree.total() == 50
+
+
+def test_find_returns_index_containing_offset():
+    tree = FenwickTree(4, 10)
+    tree.add(1, 40)  # Heights: 10, 50, 10, 10
+    assert tree.find(0) == 0
+    assert tree.find(9) == 0
+    assert tree.find(10) == 1
+    assert tree.find(59) == 1
+    assert tree.find(60) == 2
+    assert tree.find(79) == 3
+    # Offsets past the end clamp to the size
+    assert tree.find(1000) == 4
+
+
+def test_empty_tree():
+    tree = FenwickTree(0, 30)
+    assert tree.total() == 0
+    assert tree.prefix_sum(0) == 0
+    assert tree.find(100) == 0
+
+
+def test_matches_plain_list():
+    rng = random.Random(1234)
+    size = 57
+    values = [30] * size
+    tree = FenwickTree(size, 30)
+    for _ in range(200):
+        index = rng.randrange(size)
+        delta = rng.randint(-values[index], 100)
+        values[index] += delta
+        tree.add(index, delta)
+    
+    for count in range(size + 1):
+        assert tree.prefix_sum(count) == sum(values[:count])
+    assert tree.total() == sum(values)
+    
+    for offset in range(0, sum(values) + 50, 7):
+        expected = 0
+        while expected < size and sum(values[:expected + 1]) <= offset:
+            expected += 1
+        assert tree.find(offset) == expected